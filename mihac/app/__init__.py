@@ -12,22 +12,75 @@
 #   3. Un solo código, múltiples entornos
 # ============================================================
 
+import hashlib
+import os
 import sys
+import tempfile
 from pathlib import Path
 
-from flask import Flask
+import orjson
+import sqlalchemy as sa
+from flask import Flask, render_template
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
+from jinja2 import FileSystemBytecodeCache
 
 # ── Asegurar que mihac/ esté en sys.path ────────────────────
+# Flag en sys en lugar de membresía O(len(sys.path)); también
+# garantiza una única inserción aunque varios módulos ejecuten
+# este bloque.
 _APP_DIR = Path(__file__).resolve().parent
 _MIHAC_ROOT = _APP_DIR.parent
-if str(_MIHAC_ROOT) not in sys.path:
+if not getattr(sys, "_mihac_path_set", False):
     sys.path.insert(0, str(_MIHAC_ROOT))
+    sys._mihac_path_set = True
 
 # ── Extensiones (sin app todavía) ───────────────────────────
-db = SQLAlchemy()
-migrate = Migrate()
+# autoflush=False: la carga de trabajo es INSERT-dominante y no
+# necesita flushes implícitos por query.  expire_on_commit=False:
+# evita re-leer columnas de Evaluacion tras cada commit.
+db = SQLAlchemy(
+    session_options={
+        "autoflush": False,
+        "expire_on_commit": False,
+    }
+)
+cache = Cache()
+
+# ── Módulos de la app importados una sola vez ───────────────
+# Hoisted a nivel de módulo: create_app se apoya en el caché de
+# sys.modules y no repite la maquinaria de importlib en cada
+# invocación (relevante cuando pytest crea muchas apps).
+# Nota: deben ir después de `db = SQLAlchemy()` porque estos
+# módulos hacen `from app import db` al importarse.
+from app import models as _models  # noqa: E402
+from app.config import CONFIG_SNAPSHOTS  # noqa: E402
+from app.routes import main as _main_blueprint  # noqa: E402
+from app.utils import (  # noqa: E402
+    color_dictamen,
+    clase_badge_dictamen,
+    formato_moneda,
+    formato_porcentaje,
+    texto_historial,
+)
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Proveedor JSON de la app basado en orjson.
+
+    Sustituye al encoder de la stdlib en jsonify y en el filtro
+    |tojson de Jinja; OPT_NON_STR_KEYS cubre dicts con claves
+    numéricas (p.ej. buckets de gráficas).
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 
 def create_app(config_name: str = "development") -> Flask:
@@ -46,18 +99,46 @@ def create_app(config_name: str = "development") -> Flask:
         template_folder="templates",
     )
 
+    # Proveedor JSON orjson: jsonify, |tojson y las respuestas
+    # JSON de toda la app usan el encoder en C.
+    app.json = _OrjsonProvider(app)
+
+    # ── Caché de bytecode Jinja compartida entre apps ───────
+    # La primera instancia paga la compilación de templates; las
+    # siguientes (p.ej. una app por test) reutilizan el bytecode
+    # persistido en disco.
+    app.config["EXPLAIN_TEMPLATE_LOADING"] = False
+    app.jinja_env.bytecode_cache = _jinja_bytecode_cache()
+
     # ── Cargar configuración ────────────────────────────────
-    from app.config import config_map
-    cfg = config_map.get(config_name, config_map["development"])
-    app.config.from_object(cfg)
+    cfg = CONFIG_SNAPSHOTS.get(
+        config_name, CONFIG_SNAPSHOTS["development"]
+    )
+    app.config.update(cfg)
 
     # ── Inicializar extensiones ─────────────────────────────
     db.init_app(app)
-    migrate.init_app(app, db)
+    cache.init_app(app)
+
+    # Flask-Migrate se importa bajo demanda: los workers de
+    # producción no pagan el arranque de Alembic/Mako salvo
+    # que se pida explícitamente vía FLASK_MIGRATE=1.
+    if app.config.get("DEBUG") or os.environ.get("FLASK_MIGRATE"):
+        from flask_migrate import Migrate
+        Migrate(app, db)
+
+    # ── PRAGMAs SQLite por conexión (WAL + menos fsyncs) ────
+    with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            sa.event.listens_for(db.engine, "connect")(
+                _sqlite_on_connect
+            )
+
+    # Solo recompilar templates al vuelo durante desarrollo
+    app.jinja_env.auto_reload = bool(app.config.get("DEBUG"))
 
     # ── Registrar blueprints ────────────────────────────────
-    from app.routes import main as main_blueprint
-    app.register_blueprint(main_blueprint)
+    app.register_blueprint(_main_blueprint)
 
     # ── Registrar error handlers ────────────────────────────
     _register_error_handlers(app)
@@ -66,38 +147,125 @@ def create_app(config_name: str = "development") -> Flask:
     _register_template_filters(app)
 
     # ── Crear tablas si no existen ──────────────────────────
-    with app.app_context():
-        from app import models  # noqa: F401
-        db.create_all()
+    # Solo verifica/crea el esquema cuando MIHAC_AUTO_CREATE
+    # está activo; en producción el esquema lo gestionan las
+    # migraciones (flask-migrate).
+    if app.config.get("MIHAC_AUTO_CREATE", True):
+        with app.app_context():
+            _ensure_schema()
 
     return app
 
 
+_schema_hash_cache: str | None = None
+
+
+def _schema_hash() -> str:
+    """Hash estable del esquema declarado en db.metadata."""
+    global _schema_hash_cache
+    if _schema_hash_cache is None:
+        firma = repr(sorted(
+            (t.name, tuple(c.name for c in t.columns))
+            for t in db.metadata.tables.values()
+        ))
+        _schema_hash_cache = hashlib.sha1(
+            firma.encode()
+        ).hexdigest()
+    return _schema_hash_cache
+
+
+def _ensure_schema() -> None:
+    """Crea el esquema solo cuando el hash almacenado difiere.
+
+    Una tabla auxiliar schema_meta guarda el hash del esquema
+    vigente; en arranques calientes la verificación es un único
+    SELECT en vez de los PRAGMA table_info de create_all().
+    """
+    esperado = _schema_hash()
+    try:
+        actual = db.session.execute(
+            sa.text("SELECT hash FROM schema_meta LIMIT 1")
+        ).scalar()
+        if actual == esperado:
+            return
+    except sa.exc.DatabaseError:
+        db.session.rollback()
+
+    db.create_all()
+    with db.engine.begin() as conn:
+        conn.execute(sa.text(
+            "CREATE TABLE IF NOT EXISTS schema_meta "
+            "(hash TEXT NOT NULL)"
+        ))
+        conn.execute(sa.text("DELETE FROM schema_meta"))
+        conn.execute(
+            sa.text(
+                "INSERT INTO schema_meta (hash) VALUES (:h)"
+            ),
+            {"h": esperado},
+        )
+
+
+_bytecode_cache: FileSystemBytecodeCache | None = None
+
+
+def _jinja_bytecode_cache() -> FileSystemBytecodeCache:
+    """Devuelve la caché de bytecode Jinja (singleton)."""
+    global _bytecode_cache
+    if _bytecode_cache is None:
+        directorio = os.path.join(
+            tempfile.gettempdir(), "mihac_jinja"
+        )
+        os.makedirs(directorio, exist_ok=True)
+        _bytecode_cache = FileSystemBytecodeCache(
+            directory=directorio
+        )
+    return _bytecode_cache
+
+
+def _sqlite_on_connect(dbapi_conn, _record) -> None:
+    """Configura cada conexión SQLite para escritura rápida.
+
+    WAL permite lecturas concurrentes con escrituras y
+    synchronous=NORMAL reduce fsyncs sin riesgo de corrupción
+    bajo WAL.
+    """
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.close()
+
+
+def _not_found(e):
+    return render_template("errors/404.html"), 404
+
+
+def _server_error(e):
+    return render_template("errors/500.html"), 500
+
+
 def _register_error_handlers(app: Flask) -> None:
-    """Registra páginas de error personalizadas."""
-    from flask import render_template
+    """Registra páginas de error personalizadas.
+
+    Los handlers viven a nivel de módulo y se registran por
+    referencia: no se crean closures nuevos por create_app.
+    """
+    app.register_error_handler(404, _not_found)
+    app.register_error_handler(500, _server_error)
 
-    @app.errorhandler(404)
-    def not_found(e):
-        return render_template("errors/404.html"), 404
 
-    @app.errorhandler(500)
-    def server_error(e):
-        return render_template("errors/500.html"), 500
+# Tabla de filtros construida una vez; se registra con un solo
+# update() por app en lugar de cinco asignaciones.
+_TEMPLATE_FILTERS = {
+    "color_dictamen": color_dictamen,
+    "clase_badge": clase_badge_dictamen,
+    "moneda": formato_moneda,
+    "porcentaje": formato_porcentaje,
+    "texto_historial": texto_historial,
+}
 
 
 def _register_template_filters(app: Flask) -> None:
     """Registra filtros Jinja2 personalizados."""
-    from app.utils import (
-        color_dictamen,
-        clase_badge_dictamen,
-        formato_moneda,
-        formato_porcentaje,
-        texto_historial,
-    )
-
-    app.jinja_env.filters["color_dictamen"] = color_dictamen
-    app.jinja_env.filters["clase_badge"] = clase_badge_dictamen
-    app.jinja_env.filters["moneda"] = formato_moneda
-    app.jinja_env.filters["porcentaje"] = formato_porcentaje
-    app.jinja_env.filters["texto_historial"] = texto_historial
+    app.jinja_env.filters.update(_TEMPLATE_FILTERS)
@@ -9,9 +9,13 @@
 import os
 from pathlib import Path
 
-# Directorio raíz de mihac/
+# Directorio raíz de mihac/ (resuelto una sola vez)
 _MIHAC_ROOT = Path(__file__).resolve().parent.parent
 
+# Ruta del directorio de BD como string precomputado: evita
+# Path.__truediv__ + __str__ por cada clase de configuración.
+_DB_DIR_STR = str(_MIHAC_ROOT / "instance")
+
 
 class Config:
     """Configuración base compartida por todos los entornos."""
@@ -21,6 +25,21 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Crear tablas automáticamente al levantar la app
+    # (desactivado en producción: ahí manda flask-migrate)
+    MIHAC_AUTO_CREATE = True
+
+    # Caché de vistas (dashboard/historial). SimpleCache en
+    # proceso por defecto; apuntar a Redis vía env vars cuando
+    # haya múltiples workers.
+    CACHE_TYPE = os.environ.get(
+        "MIHAC_CACHE_TYPE", "SimpleCache"
+    )
+    CACHE_REDIS_HOST = os.environ.get(
+        "MIHAC_CACHE_REDIS_HOST", "localhost"
+    )
+    CACHE_DEFAULT_TIMEOUT = 300
+
     # Directorio de la base de datos
     DB_DIR = _MIHAC_ROOT / "instance"
 
@@ -33,7 +52,7 @@ class DevelopmentConfig(Config):
 
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = (
-        "sqlite:///" + str(Config.DB_DIR / "mihac_dev.db")
+        f"sqlite:///{_DB_DIR_STR}/mihac_dev.db"
     )
 
 
@@ -42,18 +61,20 @@ class TestingConfig(Config):
 
     TESTING = True
     WTF_CSRF_ENABLED = False  # Deshabilitar CSRF en tests
-    SQLALCHEMY_DATABASE_URI = (
-        "sqlite:///" + str(Config.DB_DIR / "mihac_test.db")
-    )
+    # BD en memoria: evita I/O a disco en cada suite
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # Sin caché de vistas: cada test ve datos frescos
+    CACHE_TYPE = "NullCache"
 
 
 class ProductionConfig(Config):
     """Configuración para producción."""
 
     DEBUG = False
+    MIHAC_AUTO_CREATE = False
     SQLALCHEMY_DATABASE_URI = os.environ.get(
         "DATABASE_URL",
-        "sqlite:///" + str(Config.DB_DIR / "mihac_prod.db"),
+        f"sqlite:///{_DB_DIR_STR}/mihac_prod.db",
     )
 
 
@@ -64,3 +85,19 @@ config_map = {
     "production": ProductionConfig,
     "default": DevelopmentConfig,
 }
+
+
+def _snapshot(cls: type) -> dict:
+    """Congela los atributos de config de una clase en un dict."""
+    return {
+        k: getattr(cls, k)
+        for k in dir(cls)
+        if k.isupper()
+    }
+
+
+# Snapshots congelados por entorno: evitan el recorrido O(N) de
+# dir(cls) que hace app.config.from_object() en cada create_app.
+CONFIG_SNAPSHOTS = {
+    name: _snapshot(cls) for name, cls in config_map.items()
+}
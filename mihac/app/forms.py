@@ -17,6 +17,7 @@ from wtforms.validators import (
     DataRequired,
     NumberRange,
     InputRequired,
+    ValidationError,
 )
 
 # Límites importados desde la configuración central
@@ -24,8 +25,9 @@ import sys
 from pathlib import Path
 
 _MIHAC_ROOT = Path(__file__).resolve().parent.parent
-if str(_MIHAC_ROOT) not in sys.path:
+if not getattr(sys, "_mihac_path_set", False):
     sys.path.insert(0, str(_MIHAC_ROOT))
+    sys._mihac_path_set = True
 
 from config import (
     EDAD_MIN,
@@ -40,9 +42,42 @@ from config import (
     MONTO_CREDITO_MAX,
     HISTORIAL_VALORES,
     TIPOS_VIVIENDA,
+    TIPOS_VIVIENDA_SET,
     PROPOSITOS_CREDITO,
+    PROPOSITOS_CREDITO_SET,
 )
 
+# ── Choices precompiladas (una sola vez al importar) ────────
+# Tuplas inmutables compartidas por todas las instancias del
+# formulario; evita reconstruir las listas por request.
+_PLACEHOLDER = ("", "Seleccionar...")
+
+_HISTORIAL_CHOICES = (_PLACEHOLDER,) + tuple(
+    (str(k), v) for k, v in HISTORIAL_VALORES.items()
+)
+_VIVIENDA_CHOICES = (_PLACEHOLDER,) + tuple(
+    (t, t) for t in TIPOS_VIVIENDA
+)
+_PROPOSITO_CHOICES = (_PLACEHOLDER,) + tuple(
+    (p, p) for p in PROPOSITOS_CREDITO
+)
+
+# Conjuntos para validación O(1) de pertenencia; los de
+# categorías vienen precompilados desde config.
+_HISTORIAL_SET = frozenset(
+    str(k) for k in HISTORIAL_VALORES
+)
+_VIVIENDA_SET = TIPOS_VIVIENDA_SET
+_PROPOSITO_SET = PROPOSITOS_CREDITO_SET
+
+
+def _en_conjunto(valores: frozenset, mensaje: str):
+    """Crea un validador de pertenencia con lookup O(1)."""
+    def _validar(form, field):
+        if field.data not in valores:
+            raise ValidationError(mensaje)
+    return _validar
+
 
 class EvaluacionForm(FlaskForm):
     """Formulario de evaluación crediticia MIHAC.
@@ -109,11 +144,13 @@ class EvaluacionForm(FlaskForm):
     # ── 4. Historial crediticio ─────────────────────────────
     historial_crediticio = SelectField(
         "Historial crediticio",
-        choices=[("", "Seleccionar...")] + [
-            (str(k), v) for k, v in HISTORIAL_VALORES.items()
-        ],
+        choices=_HISTORIAL_CHOICES,
         validators=[
             DataRequired(message="Selecciona un historial."),
+            _en_conjunto(
+                _HISTORIAL_SET,
+                "Historial crediticio no válido.",
+            ),
         ],
         render_kw={"class": "form-select"},
         coerce=str,
@@ -164,11 +201,13 @@ class EvaluacionForm(FlaskForm):
     # ── 7. Tipo de vivienda ─────────────────────────────────
     tipo_vivienda = SelectField(
         "Tipo de vivienda",
-        choices=[("", "Seleccionar...")] + [
-            (t, t) for t in TIPOS_VIVIENDA
-        ],
+        choices=_VIVIENDA_CHOICES,
         validators=[
             DataRequired(message="Selecciona un tipo de vivienda."),
+            _en_conjunto(
+                _VIVIENDA_SET,
+                "Tipo de vivienda no válido.",
+            ),
         ],
         render_kw={"class": "form-select"},
     )
@@ -176,13 +215,15 @@ class EvaluacionForm(FlaskForm):
     # ── 8. Propósito del crédito ────────────────────────────
     proposito_credito = SelectField(
         "Propósito del crédito",
-        choices=[("", "Seleccionar...")] + [
-            (p, p) for p in PROPOSITOS_CREDITO
-        ],
+        choices=_PROPOSITO_CHOICES,
         validators=[
             DataRequired(
                 message="Selecciona el propósito del crédito."
             ),
+            _en_conjunto(
+                _PROPOSITO_SET,
+                "Propósito del crédito no válido.",
+            ),
         ],
         render_kw={"class": "form-select"},
     )
@@ -7,11 +7,42 @@
 # y metadata de auditoría.
 # ============================================================
 
-import json
 from datetime import datetime
 from typing import Any
 
+import orjson
+from sqlalchemy import and_, case, event, insert, inspect, select
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
+
 from app import db
+from config import TIPOS_VIVIENDA, PROPOSITOS_CREDITO
+
+
+class JSONText(TypeDecorator):
+    """Columna TEXT que (de)serializa JSON con orjson.
+
+    La serialización ocurre una sola vez en el flush y la
+    deserialización una sola vez al cargar la fila; el código
+    de la app trabaja directamente con listas/dicts.
+    """
+
+    impl = db.Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return orjson.dumps(value).decode("utf-8")
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
 
 
 class Evaluacion(db.Model):
@@ -24,46 +55,95 @@ class Evaluacion(db.Model):
 
     __tablename__ = "evaluaciones"
 
+    # Índices para el historial (orden por fecha/score + filtro
+    # por dictamen) y los buckets/group-by del dashboard.
+    __table_args__ = (
+        db.Index("ix_eval_ts_dict", "timestamp", "dictamen"),
+        db.Index("ix_eval_dictamen", "dictamen"),
+        db.Index("ix_ev_dictamen_ts", "dictamen", "timestamp"),
+        db.Index(
+            "ix_ev_dictamen_score", "dictamen", "score_final"
+        ),
+        db.Index("ix_ev_score", "score_final"),
+        db.Index("ix_ev_dti", "dti_ratio"),
+        db.Index("ix_ev_proposito", "proposito_credito"),
+    )
+
     # ── Clave primaria ──────────────────────────────────────
-    id = db.Column(db.Integer, primary_key=True)
-    timestamp = db.Column(
-        db.DateTime, default=datetime.utcnow, nullable=False
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # server_default: el timestamp lo escribe SQLite en C; se
+    # ahorra una llamada Python y un bind por INSERT.
+    timestamp: Mapped[datetime] = mapped_column(
+        db.DateTime,
+        server_default=func.now(),
+        nullable=False,
+        index=True,
     )
 
     # ── Datos del solicitante (9 variables de entrada) ──────
-    edad = db.Column(db.Integer, nullable=False)
-    ingreso_mensual = db.Column(db.Float, nullable=False)
-    total_deuda_actual = db.Column(db.Float, nullable=False)
-    historial_crediticio = db.Column(
-        db.Integer, nullable=False
+    edad: Mapped[int] = mapped_column(nullable=False)
+    ingreso_mensual: Mapped[float] = mapped_column(
+        nullable=False
+    )
+    total_deuda_actual: Mapped[float] = mapped_column(
+        nullable=False
+    )
+    historial_crediticio: Mapped[int] = mapped_column(
+        db.SmallInteger, nullable=False
     )  # 0=Malo, 1=Neutro, 2=Bueno
-    antiguedad_laboral = db.Column(db.Integer, nullable=False)
-    numero_dependientes = db.Column(db.Integer, nullable=False)
-    tipo_vivienda = db.Column(db.String(20), nullable=False)
-    proposito_credito = db.Column(db.String(20), nullable=False)
-    monto_credito = db.Column(db.Float, nullable=False)
+    antiguedad_laboral: Mapped[int] = mapped_column(
+        nullable=False
+    )
+    numero_dependientes: Mapped[int] = mapped_column(
+        nullable=False
+    )
+    # Enums no nativos: dominio cerrado con CHECK en BD y
+    # longitud acotada al valor más largo, sin cambiar el tipo
+    # Python (siguen siendo str para rutas y templates).
+    tipo_vivienda: Mapped[str] = mapped_column(
+        db.Enum(*TIPOS_VIVIENDA, native_enum=False),
+        nullable=False,
+    )
+    proposito_credito: Mapped[str] = mapped_column(
+        db.Enum(*PROPOSITOS_CREDITO, native_enum=False),
+        nullable=False,
+    )
+    monto_credito: Mapped[float] = mapped_column(
+        nullable=False
+    )
 
     # ── Resultados del motor ────────────────────────────────
-    score_final = db.Column(db.Integer, nullable=False)
-    dti_ratio = db.Column(db.Float, nullable=False)
-    dti_clasificacion = db.Column(db.String(20), nullable=False)
-    dictamen = db.Column(
+    score_final: Mapped[int] = mapped_column(nullable=False)
+    dti_ratio: Mapped[float] = mapped_column(nullable=False)
+    dti_clasificacion: Mapped[str] = mapped_column(
+        db.String(20), nullable=False
+    )
+    dictamen: Mapped[str] = mapped_column(
         db.String(20), nullable=False
     )  # APROBADO, RECHAZADO, REVISION_MANUAL
-    umbral_aplicado = db.Column(db.Integer, nullable=False)
-    reglas_activadas = db.Column(
-        db.Text, nullable=False, default="[]"
-    )  # JSON string
-    sub_scores = db.Column(
-        db.Text, nullable=False, default="{}"
-    )  # JSON string
-    reporte_explicacion = db.Column(db.Text, nullable=False)
+    umbral_aplicado: Mapped[int] = mapped_column(
+        nullable=False
+    )
+    # Columnas TEXT grandes diferidas: las vistas de listado
+    # (historial, dashboard) no pagan su carga; las vistas de
+    # detalle las piden con undefer().
+    reglas_activadas: Mapped[list] = mapped_column(
+        JSONText, nullable=False, default=list, deferred=True
+    )  # lista de reglas (JSON en BD)
+    sub_scores: Mapped[dict] = mapped_column(
+        JSONText, nullable=False, default=dict, deferred=True
+    )  # dict de sub-scores (JSON en BD)
+    reporte_explicacion: Mapped[str] = mapped_column(
+        db.Text, nullable=False, deferred=True
+    )
 
     # ── Metadata ────────────────────────────────────────────
-    analista_usuario = db.Column(
-        db.String(50), nullable=True
+    analista_usuario: Mapped[str | None] = mapped_column(
+        db.String(50)
+    )
+    notas_adicionales: Mapped[str | None] = mapped_column(
+        db.Text
     )
-    notas_adicionales = db.Column(db.Text, nullable=True)
 
     def __repr__(self) -> str:
         return (
@@ -78,131 +158,458 @@ class Evaluacion(db.Model):
     def to_dict(self) -> dict[str, Any]:
         """Convierte el modelo a diccionario para JSON API.
 
+        El dict se memoiza en la instancia: templates y rutas
+        suelen llamarlo varias veces por request. La caché se
+        invalida cuando SQLAlchemy refresca la instancia.
+
         Returns:
             Dict con todos los campos serializados.
         """
+        d = self.__dict__.get("_dict_cache")
+        if d is None:
+            d = self._build_dict()
+            self.__dict__["_dict_cache"] = d
+        return d
+
+    def _build_dict(self) -> dict[str, Any]:
+        """Construye el dict de serialización desde cero.
+
+        Lee los atributos ya cargados vía inspect().dict en vez
+        de pasar 18 veces por el descriptor InstrumentedAttribute;
+        las columnas diferidas caen al acceso normal (getattr)
+        que dispara su carga si hace falta.
+        """
+        loaded = inspect(self).dict
+        ts = loaded.get("timestamp")
         return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat()
-            if self.timestamp
-            else None,
+            "id": loaded.get("id"),
+            "timestamp": ts.isoformat() if ts else None,
             # Entrada
-            "edad": self.edad,
-            "ingreso_mensual": self.ingreso_mensual,
-            "total_deuda_actual": self.total_deuda_actual,
-            "historial_crediticio": self.historial_crediticio,
-            "antiguedad_laboral": self.antiguedad_laboral,
-            "numero_dependientes": self.numero_dependientes,
-            "tipo_vivienda": self.tipo_vivienda,
-            "proposito_credito": self.proposito_credito,
-            "monto_credito": self.monto_credito,
+            "edad": loaded.get("edad"),
+            "ingreso_mensual": loaded.get("ingreso_mensual"),
+            "total_deuda_actual": loaded.get(
+                "total_deuda_actual"
+            ),
+            "historial_crediticio": loaded.get(
+                "historial_crediticio"
+            ),
+            "antiguedad_laboral": loaded.get(
+                "antiguedad_laboral"
+            ),
+            "numero_dependientes": loaded.get(
+                "numero_dependientes"
+            ),
+            "tipo_vivienda": loaded.get("tipo_vivienda"),
+            "proposito_credito": loaded.get(
+                "proposito_credito"
+            ),
+            "monto_credito": loaded.get("monto_credito"),
             # Resultado
-            "score_final": self.score_final,
-            "dti_ratio": self.dti_ratio,
-            "dti_clasificacion": self.dti_clasificacion,
-            "dictamen": self.dictamen,
-            "umbral_aplicado": self.umbral_aplicado,
+            "score_final": loaded.get("score_final"),
+            "dti_ratio": loaded.get("dti_ratio"),
+            "dti_clasificacion": loaded.get(
+                "dti_clasificacion"
+            ),
+            "dictamen": loaded.get("dictamen"),
+            "umbral_aplicado": loaded.get("umbral_aplicado"),
             "reglas_activadas": self.get_reglas_list(),
             "sub_scores": self.get_sub_scores_dict(),
             "reporte_explicacion": self.reporte_explicacion,
             # Metadata
-            "analista_usuario": self.analista_usuario,
-            "notas_adicionales": self.notas_adicionales,
+            "analista_usuario": loaded.get(
+                "analista_usuario"
+            ),
+            "notas_adicionales": loaded.get(
+                "notas_adicionales"
+            ),
         }
 
     def get_reglas_list(self) -> list[dict]:
         """Deserializa las reglas activadas desde JSON.
 
+        El resultado se memoiza en la instancia: el parse de un
+        valor legado (str) ocurre a lo sumo una vez aunque la
+        vista de detalle y to_dict() lo pidan varias veces.
+
         Returns:
             Lista de dicts con las reglas (id, impacto, desc).
         """
-        try:
-            return json.loads(self.reglas_activadas or "[]")
-        except (json.JSONDecodeError, TypeError):
-            return []
+        cacheado = self.__dict__.get("_reglas_cache")
+        if cacheado is not None:
+            return cacheado
+        valor = self.reglas_activadas
+        if isinstance(valor, str):
+            # Valor aún sin pasar por el TypeDecorator
+            try:
+                valor = orjson.loads(valor)
+            except orjson.JSONDecodeError:
+                valor = []
+        valor = valor or []
+        self.__dict__["_reglas_cache"] = valor
+        return valor
 
     def get_sub_scores_dict(self) -> dict[str, Any]:
         """Deserializa los sub-scores desde JSON.
 
+        Memoizado por instancia igual que get_reglas_list().
+
         Returns:
             Dict con los 4 sub-scores.
         """
-        try:
-            return json.loads(self.sub_scores or "{}")
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        cacheado = self.__dict__.get("_subscores_cache")
+        if cacheado is not None:
+            return cacheado
+        valor = self.sub_scores
+        if isinstance(valor, str):
+            # Valor aún sin pasar por el TypeDecorator
+            try:
+                valor = orjson.loads(valor)
+            except orjson.JSONDecodeError:
+                valor = {}
+        valor = valor or {}
+        self.__dict__["_subscores_cache"] = valor
+        return valor
 
     @classmethod
-    def from_inference_result(
+    def bulk_insert(cls, rows: list[dict[str, Any]]) -> None:
+        """Inserta filas en bloque por la vía Core.
+
+        Para backfills o importación masiva (CSV): evita el
+        unit-of-work del ORM y emite un solo INSERT multi-fila.
+        Las columnas JSON pueden venir como list/dict; JSONText
+        las serializa al vincular parámetros.
+
+        Args:
+            rows: Lista de dicts columna → valor.
+        """
+        if not rows:
+            return
+        db.session.execute(insert(cls), rows)
+        db.session.commit()
+
+    @classmethod
+    def mapping_from_inference(
         cls,
         datos_entrada: dict[str, Any],
         resultado: dict[str, Any],
-    ) -> "Evaluacion":
-        """Crea una instancia desde los dicts del motor MIHAC.
+    ) -> dict[str, Any]:
+        """Arma el dict columna → valor desde los dicts del motor.
 
-        Constructor conveniente que toma los datos de entrada
-        y el resultado de InferenceEngine.evaluate() para
-        crear el registro de evaluación.
+        Base común de from_inference_result (una instancia ORM)
+        y de la vía bulk (lista de mappings para bulk_insert).
 
         Args:
-            datos_entrada: Dict con las 9 variables de entrada
-                          (edad, ingreso_mensual, etc.).
-            resultado: Dict retornado por engine.evaluate()
-                      (score_final, dictamen, reglas, etc.).
+            datos_entrada: Dict con las 9 variables de entrada.
+            resultado: Dict retornado por engine.evaluate().
 
         Returns:
-            Instancia de Evaluacion lista para db.session.add().
+            Dict listo para cls(**mapping) o bulk_insert().
         """
-        # Serializar reglas activadas a JSON
-        reglas = resultado.get("reglas_activadas", [])
-        reglas_json = json.dumps(reglas, ensure_ascii=False)
-
-        # Serializar sub-scores a JSON
-        sub_scores = resultado.get("sub_scores", {})
-        sub_scores_json = json.dumps(
-            sub_scores, ensure_ascii=False
-        )
-
-        return cls(
+        # La serialización a JSON la hace JSONText en el flush
+        return {
             # Datos de entrada
-            edad=datos_entrada.get("edad", 0),
-            ingreso_mensual=datos_entrada.get(
+            "edad": datos_entrada.get("edad", 0),
+            "ingreso_mensual": datos_entrada.get(
                 "ingreso_mensual", 0
             ),
-            total_deuda_actual=datos_entrada.get(
+            "total_deuda_actual": datos_entrada.get(
                 "total_deuda_actual", 0
             ),
-            historial_crediticio=datos_entrada.get(
+            "historial_crediticio": datos_entrada.get(
                 "historial_crediticio", 0
             ),
-            antiguedad_laboral=datos_entrada.get(
+            "antiguedad_laboral": datos_entrada.get(
                 "antiguedad_laboral", 0
             ),
-            numero_dependientes=datos_entrada.get(
+            "numero_dependientes": datos_entrada.get(
                 "numero_dependientes", 0
             ),
-            tipo_vivienda=datos_entrada.get(
+            "tipo_vivienda": datos_entrada.get(
                 "tipo_vivienda", "Rentada"
             ),
-            proposito_credito=datos_entrada.get(
+            "proposito_credito": datos_entrada.get(
                 "proposito_credito", "Consumo"
             ),
-            monto_credito=datos_entrada.get(
+            "monto_credito": datos_entrada.get(
                 "monto_credito", 0
             ),
             # Resultados del motor
-            score_final=resultado.get("score_final", 0),
-            dti_ratio=resultado.get("dti_ratio", 0.0),
-            dti_clasificacion=resultado.get(
+            "score_final": resultado.get("score_final", 0),
+            "dti_ratio": resultado.get("dti_ratio", 0.0),
+            "dti_clasificacion": resultado.get(
                 "dti_clasificacion", "N/A"
             ),
-            dictamen=resultado.get("dictamen", "RECHAZADO"),
-            umbral_aplicado=resultado.get(
+            "dictamen": resultado.get(
+                "dictamen", "RECHAZADO"
+            ),
+            "umbral_aplicado": resultado.get(
                 "umbral_aplicado", 80
             ),
-            reglas_activadas=reglas_json,
-            sub_scores=sub_scores_json,
-            reporte_explicacion=resultado.get(
+            "reglas_activadas": resultado.get(
+                "reglas_activadas", []
+            ),
+            "sub_scores": resultado.get("sub_scores", {}),
+            "reporte_explicacion": resultado.get(
                 "reporte_explicacion", ""
             ),
+        }
+
+    @classmethod
+    def from_inference_result(
+        cls,
+        datos_entrada: dict[str, Any],
+        resultado: dict[str, Any],
+    ) -> "Evaluacion":
+        """Crea una instancia desde los dicts del motor MIHAC.
+
+        Constructor conveniente que toma los datos de entrada
+        y el resultado de InferenceEngine.evaluate() para
+        crear el registro de evaluación.
+
+        Args:
+            datos_entrada: Dict con las 9 variables de entrada
+                          (edad, ingreso_mensual, etc.).
+            resultado: Dict retornado por engine.evaluate()
+                      (score_final, dictamen, reglas, etc.).
+
+        Returns:
+            Instancia de Evaluacion lista para db.session.add().
+        """
+        return cls(
+            **cls.mapping_from_inference(
+                datos_entrada, resultado
+            )
         )
+
+
+@event.listens_for(Evaluacion, "refresh")
+def _invalidar_dict_cache(target, _context, _attrs) -> None:
+    """Descarta las cachés de serialización al refrescar."""
+    target.__dict__.pop("_dict_cache", None)
+    target.__dict__.pop("_reglas_cache", None)
+    target.__dict__.pop("_subscores_cache", None)
+
+
+# ── KPIs materializados del dashboard ────────────────────────
+# Límites de los buckets del dashboard: (lo, hi) por bucket.
+# Deben coincidir con las etiquetas de app/routes.py.
+_SCORE_BUCKETS = (
+    (0, 19), (20, 39), (40, 59), (60, 79), (80, 100),
+)
+_DTI_BUCKETS = (
+    (0.0, 0.25), (0.25, 0.40), (0.40, 0.60), (0.60, 10.0),
+)
+
+
+class EvaluacionStats(db.Model):
+    """Fila única de KPIs pre-agregados del dashboard.
+
+    La carga de trabajo es append-only: cada evaluación nueva
+    incrementa los contadores en la misma transacción que el
+    INSERT, y el dashboard lee esta fila en O(1) sin escanear
+    la tabla evaluaciones. recompute() reconstruye la fila
+    desde cero para corregir deriva (cargas externas, seeds).
+    """
+
+    __tablename__ = "evaluacion_stats"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    total: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    aprobados: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    rechazados: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    revision: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+
+    # Sumas (promedio = suma / total)
+    sum_score: Mapped[float] = mapped_column(
+        nullable=False, default=0.0
+    )
+    sum_dti: Mapped[float] = mapped_column(
+        nullable=False, default=0.0
+    )
+    sum_monto: Mapped[float] = mapped_column(
+        nullable=False, default=0.0
+    )
+
+    # Buckets de score (0–19, 20–39, 40–59, 60–79, 80–100)
+    score_b0: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    score_b1: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    score_b2: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    score_b3: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    score_b4: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+
+    # Buckets de DTI (<25%, 25–40%, 40–60%, >60%)
+    dti_b0: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    dti_b1: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    dti_b2: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+    dti_b3: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )
+
+    # Conteo por propósito de crédito (dict JSON en BD)
+    propositos: Mapped[dict] = mapped_column(
+        JSONText, nullable=False, default=dict
+    )
+
+    @staticmethod
+    def _bucket_score(score: int) -> int:
+        """Índice de bucket de score (rangos de 20 puntos)."""
+        return min(int(score) // 20, 4)
+
+    @staticmethod
+    def _bucket_dti(dti: float) -> int:
+        """Índice de bucket de DTI según los umbrales."""
+        if dti < 0.25:
+            return 0
+        if dti < 0.40:
+            return 1
+        if dti < 0.60:
+            return 2
+        return 3
+
+    @classmethod
+    def registrar(cls, evaluacion: Evaluacion) -> None:
+        """Acumula una evaluación nueva en los contadores.
+
+        Debe llamarse antes del commit que persiste la
+        evaluación, para que el INSERT y la actualización de
+        stats queden en la misma transacción.
+
+        Args:
+            evaluacion: Instancia recién agregada a la sesión.
+        """
+        stats = db.session.get(cls, 1)
+        if stats is None:
+            # Los default=0 de las columnas aplican al INSERT,
+            # no al constructor: inicializar en Python para
+            # poder acumular antes del flush.
+            stats = cls(
+                id=1, total=0, aprobados=0, rechazados=0,
+                revision=0, sum_score=0.0, sum_dti=0.0,
+                sum_monto=0.0, score_b0=0, score_b1=0,
+                score_b2=0, score_b3=0, score_b4=0,
+                dti_b0=0, dti_b1=0, dti_b2=0, dti_b3=0,
+                propositos={},
+            )
+            db.session.add(stats)
+            # Flush para que llamadas sucesivas dentro de la
+            # misma transacción encuentren la fila vía get()
+            # en lugar de duplicar el INSERT con id=1.
+            db.session.flush()
+
+        stats.total += 1
+        if evaluacion.dictamen == "APROBADO":
+            stats.aprobados += 1
+        elif evaluacion.dictamen == "RECHAZADO":
+            stats.rechazados += 1
+        else:
+            stats.revision += 1
+
+        stats.sum_score += evaluacion.score_final
+        stats.sum_dti += evaluacion.dti_ratio
+        stats.sum_monto += evaluacion.monto_credito
+
+        sb = cls._bucket_score(evaluacion.score_final)
+        setattr(stats, f"score_b{sb}",
+                getattr(stats, f"score_b{sb}") + 1)
+        dbk = cls._bucket_dti(evaluacion.dti_ratio)
+        setattr(stats, f"dti_b{dbk}",
+                getattr(stats, f"dti_b{dbk}") + 1)
+
+        # Reasignación (no mutación in-place) para que el ORM
+        # detecte el cambio en la columna JSON
+        props = dict(stats.propositos or {})
+        prop = evaluacion.proposito_credito
+        props[prop] = props.get(prop, 0) + 1
+        stats.propositos = props
+
+    @classmethod
+    def recompute(cls) -> "EvaluacionStats":
+        """Reconstruye la fila de stats desde evaluaciones.
+
+        Un solo scan agregado de la tabla; pensado para corregir
+        deriva tras cargas que no pasan por registrar().
+
+        Returns:
+            La fila de stats ya actualizada y commiteada.
+        """
+        def _conteo_si(cond):
+            return func.sum(case((cond, 1), else_=0))
+
+        fila = db.session.execute(select(
+            func.count(Evaluacion.id),
+            _conteo_si(Evaluacion.dictamen == "APROBADO"),
+            _conteo_si(Evaluacion.dictamen == "RECHAZADO"),
+            _conteo_si(
+                Evaluacion.dictamen == "REVISION_MANUAL"
+            ),
+            func.coalesce(func.sum(Evaluacion.score_final), 0),
+            func.coalesce(func.sum(Evaluacion.dti_ratio), 0.0),
+            func.coalesce(
+                func.sum(Evaluacion.monto_credito), 0.0
+            ),
+            *(
+                _conteo_si(and_(
+                    Evaluacion.score_final >= lo,
+                    Evaluacion.score_final <= hi,
+                ))
+                for lo, hi in _SCORE_BUCKETS
+            ),
+            *(
+                _conteo_si(and_(
+                    Evaluacion.dti_ratio >= lo,
+                    Evaluacion.dti_ratio < hi,
+                ))
+                for lo, hi in _DTI_BUCKETS
+            ),
+        )).one()
+
+        props = db.session.execute(
+            select(
+                Evaluacion.proposito_credito,
+                func.count(Evaluacion.id),
+            ).group_by(Evaluacion.proposito_credito)
+        ).all()
+
+        stats = db.session.get(cls, 1)
+        if stats is None:
+            stats = cls(id=1)
+            db.session.add(stats)
+
+        (stats.total, stats.aprobados, stats.rechazados,
+         stats.revision) = fila[:4]
+        stats.sum_score = fila[4]
+        stats.sum_dti = fila[5]
+        stats.sum_monto = fila[6]
+        for i, v in enumerate(fila[7:12]):
+            setattr(stats, f"score_b{i}", v or 0)
+        for i, v in enumerate(fila[12:16]):
+            setattr(stats, f"dti_b{i}", v or 0)
+        stats.propositos = {p: c for p, c in props}
+
+        db.session.commit()
+        return stats
@@ -5,10 +5,20 @@
 # Blueprint principal con las rutas de la interfaz.
 # ============================================================
 
+import base64
+import binascii
+import csv
+import hashlib
 import logging
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+
+import click
 
 from flask import (
     Blueprint,
+    jsonify,
     render_template,
     redirect,
     url_for,
@@ -17,21 +27,65 @@ from flask import (
     send_file,
 )
 
-from app import db
+from app import cache, db
 from app.forms import EvaluacionForm
-from app.models import Evaluacion
+from app.models import Evaluacion, EvaluacionStats
+from app.utils import clasificar_dti
 from core.engine import InferenceEngine
 from reports.pdf_report import PDFReportGenerator
 
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import load_only, undefer
+
 logger = logging.getLogger(__name__)
 
 main = Blueprint("main", __name__)
 
-# Motor de inferencia (instancia única por proceso)
-_engine = InferenceEngine()
+# Opciones para vistas de detalle: cargar también las columnas
+# TEXT diferidas del modelo (ver app/models.py).
+_DETALLE_OPTS = (
+    undefer(Evaluacion.reglas_activadas),
+    undefer(Evaluacion.sub_scores),
+    undefer(Evaluacion.reporte_explicacion),
+)
+
 
-# Generador de PDFs (instancia única)
-_pdf_gen = PDFReportGenerator()
+# Columnas mínimas para filas de listado (historial, últimas
+# del dashboard); el resto queda diferido.
+_LISTADO_OPTS = (
+    load_only(
+        Evaluacion.id,
+        Evaluacion.timestamp,
+        Evaluacion.dictamen,
+        Evaluacion.score_final,
+        Evaluacion.monto_credito,
+        Evaluacion.dti_ratio,
+        Evaluacion.proposito_credito,
+    ),
+)
+
+
+def _obtener_evaluacion_completa(eval_id: int) -> Evaluacion:
+    """Carga una evaluación con todas sus columnas o aborta 404."""
+    return db.get_or_404(
+        Evaluacion, eval_id, options=list(_DETALLE_OPTS)
+    )
+
+# Singletons perezosos: el motor y el generador de PDFs cargan
+# reglas/templates al instanciarse, así que se difieren hasta el
+# primer uso en vez de pagarse al importar el módulo en cada
+# worker. lru_cache(maxsize=1) garantiza una instancia por
+# proceso y es thread-safe.
+@lru_cache(maxsize=1)
+def _get_engine() -> InferenceEngine:
+    """Instancia única del motor de inferencia."""
+    return InferenceEngine()
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_gen() -> PDFReportGenerator:
+    """Instancia única del generador de PDFs."""
+    return PDFReportGenerator()
 
 
 # ════════════════════════════════════════════════════════════
@@ -66,7 +120,7 @@ def index():
 
         # Ejecutar motor de inferencia
         try:
-            resultado = _engine.evaluate(datos_entrada)
+            resultado = _get_engine().evaluate(datos_entrada)
         except Exception as e:
             logger.error("Error al evaluar: %s", e)
             flash(
@@ -89,6 +143,9 @@ def index():
                 datos_entrada, resultado
             )
             db.session.add(evaluacion)
+            # KPIs materializados: misma transacción que el
+            # INSERT (ver EvaluacionStats)
+            EvaluacionStats.registrar(evaluacion)
             db.session.commit()
             logger.info(
                 "Evaluación #%d guardada: %s (score=%d)",
@@ -106,6 +163,10 @@ def index():
             )
             return render_template("index.html", form=form)
 
+        # Invalidar agregados cacheados del dashboard
+        cache.delete("dashboard_v1")
+        cache.delete("charts_v1")
+
         # Redirigir a página de resultado
         flash("Evaluación completada exitosamente.", "success")
         return redirect(
@@ -119,44 +180,44 @@ def index():
 # RUTA: RESULTADO DE EVALUACIÓN
 # ════════════════════════════════════════════════════════════
 
+# Especificación de sub-scores (clave, etiqueta, máximo) y
+# paleta rojo/ámbar/verde: constantes de módulo, no se
+# reconstruyen en cada request.
+_SUBSCORE_SPEC = (
+    ("solvencia", "Solvencia", 40),
+    ("estabilidad", "Estabilidad", 30),
+    ("historial_score", "Historial", 20),
+    ("perfil", "Perfil", 10),
+)
+_COLORS = ("#EF4444", "#F59E0B", "#10B981")
+
+
+def _info_sub_scores(sub_scores: dict) -> dict:
+    """Arma la info de barras de sub-scores para el template."""
+    info = {}
+    for key, label, max_val in _SUBSCORE_SPEC:
+        valor = sub_scores.get(key, 0)
+        pct = int(valor * 100 / max_val)
+        info[key] = {
+            "label": label,
+            "valor": valor,
+            "max": max_val,
+            "pct": pct,
+            # bool se suma como 0/1: índice directo a la paleta
+            "color": _COLORS[(pct >= 30) + (pct >= 60)],
+        }
+    return info
+
+
 @main.route("/resultado/<int:eval_id>")
 def resultado(eval_id):
     """Muestra el resultado detallado de una evaluación."""
-    from app.utils import clasificar_dti
-
-    evaluacion = Evaluacion.query.get_or_404(eval_id)
+    evaluacion = _obtener_evaluacion_completa(eval_id)
     reglas = evaluacion.get_reglas_list()
     sub_scores = evaluacion.get_sub_scores_dict()
     dti_info = clasificar_dti(evaluacion.dti_ratio)
 
-    # Preparar info de sub-scores para el template
-    maximos = {
-        "solvencia": 40,
-        "estabilidad": 30,
-        "historial_score": 20,
-        "perfil": 10,
-    }
-    labels = {
-        "solvencia": "Solvencia",
-        "estabilidad": "Estabilidad",
-        "historial_score": "Historial",
-        "perfil": "Perfil",
-    }
-    sub_scores_info = {}
-    for key, max_val in maximos.items():
-        valor = sub_scores.get(key, 0)
-        pct = (valor / max_val * 100) if max_val > 0 else 0
-        sub_scores_info[key] = {
-            "label": labels.get(key, key),
-            "valor": valor,
-            "max": max_val,
-            "pct": round(pct, 1),
-            "color": (
-                "#10B981" if pct >= 60
-                else "#F59E0B" if pct >= 30
-                else "#EF4444"
-            ),
-        }
+    sub_scores_info = _info_sub_scores(sub_scores)
 
     return render_template(
         "resultado.html",
@@ -173,45 +234,104 @@ def resultado(eval_id):
 
 PER_PAGE = 15
 
+# Ordenamientos del historial: (columna, descendente). Las
+# expresiones de columna son inmutables y thread-safe, así que
+# el mapa se construye una sola vez a nivel de módulo.
+_ORDEN_MAP = {
+    "reciente": (Evaluacion.timestamp, True),
+    "antiguo": (Evaluacion.timestamp, False),
+    "score_alto": (Evaluacion.score_final, True),
+    "score_bajo": (Evaluacion.score_final, False),
+}
+
+
+def _codificar_cursor(valor, ultimo_id: int) -> str:
+    """Serializa (valor de orden, id) a un cursor base64."""
+    bruto = f"{valor}|{ultimo_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(bruto).decode("ascii")
+
+
+def _decodificar_cursor(cursor: str, es_timestamp: bool):
+    """Decodifica un cursor; None si es inválido."""
+    try:
+        bruto = base64.urlsafe_b64decode(
+            cursor.encode("ascii")
+        ).decode("utf-8")
+        valor, ultimo_id = bruto.rsplit("|", 1)
+        if es_timestamp:
+            return (datetime.fromisoformat(valor), int(ultimo_id))
+        return (int(valor), int(ultimo_id))
+    except (ValueError, binascii.Error):
+        return None
+
+
 @main.route("/historial")
 def historial():
-    """Historial paginado de evaluaciones con filtros."""
+    """Historial de evaluaciones con filtros y paginación keyset.
+
+    En lugar de COUNT(*) + OFFSET (ambos O(N) por página), se
+    pagina con un cursor (valor de orden, id) codificado en
+    base64: cada página cuesta O(PER_PAGE) sin importar la
+    profundidad, y se detecta "hay siguiente" pidiendo una fila
+    extra.
+    """
     # Parámetros de filtro
     filtro_dictamen = request.args.get("dictamen", "").strip()
     filtro_orden = request.args.get("orden", "reciente").strip()
-    pagina = request.args.get("page", 1, type=int)
+    cursor_bruto = request.args.get("cursor", "").strip()
 
-    # Query base
-    query = Evaluacion.query
+    # Query base (solo columnas de listado)
+    query = Evaluacion.query.options(*_LISTADO_OPTS)
 
     # Filtro por dictamen
     if filtro_dictamen in ("APROBADO", "RECHAZADO", "REVISION_MANUAL"):
         query = query.filter(Evaluacion.dictamen == filtro_dictamen)
 
-    # Ordenamiento
-    orden_map = {
-        "reciente": Evaluacion.timestamp.desc(),
-        "antiguo": Evaluacion.timestamp.asc(),
-        "score_alto": Evaluacion.score_final.desc(),
-        "score_bajo": Evaluacion.score_final.asc(),
-    }
-    orden = orden_map.get(filtro_orden, Evaluacion.timestamp.desc())
-    query = query.order_by(orden)
-
-    # Contar total
-    total = query.count()
-    paginas = max(1, (total + PER_PAGE - 1) // PER_PAGE)
-    pagina = max(1, min(pagina, paginas))
+    # Ordenamiento (columna + sentido)
+    columna, descendente = _ORDEN_MAP.get(
+        filtro_orden, _ORDEN_MAP["reciente"]
+    )
+    if descendente:
+        query = query.order_by(
+            columna.desc(), Evaluacion.id.desc()
+        )
+    else:
+        query = query.order_by(
+            columna.asc(), Evaluacion.id.asc()
+        )
 
-    # Paginar
-    evaluaciones = query.offset((pagina - 1) * PER_PAGE).limit(PER_PAGE).all()
+    # Aplicar cursor keyset si viene en la URL
+    es_timestamp = columna is Evaluacion.timestamp
+    cursor = (
+        _decodificar_cursor(cursor_bruto, es_timestamp)
+        if cursor_bruto else None
+    )
+    if cursor is not None:
+        clave = tuple_(columna, Evaluacion.id)
+        if descendente:
+            query = query.filter(clave < cursor)
+        else:
+            query = query.filter(clave > cursor)
+
+    # Pedir una fila extra para saber si hay página siguiente
+    filas = query.limit(PER_PAGE + 1).all()
+    hay_siguiente = len(filas) > PER_PAGE
+    evaluaciones = filas[:PER_PAGE]
+
+    cursor_siguiente = ""
+    if hay_siguiente and evaluaciones:
+        ultima = evaluaciones[-1]
+        valor = (
+            ultima.timestamp.isoformat()
+            if es_timestamp else ultima.score_final
+        )
+        cursor_siguiente = _codificar_cursor(valor, ultima.id)
 
     return render_template(
         "historial.html",
         evaluaciones=evaluaciones,
-        total=total,
-        pagina=pagina,
-        paginas=paginas,
+        hay_siguiente=hay_siguiente,
+        cursor_siguiente=cursor_siguiente,
         filtro_dictamen=filtro_dictamen,
         filtro_orden=filtro_orden,
     )
@@ -221,115 +341,162 @@ def historial():
 # RUTA: DASHBOARD ANALÍTICO
 # ════════════════════════════════════════════════════════════
 
-@main.route("/dashboard")
-def dashboard():
-    """Dashboard con KPIs, gráficas y estadísticas agregadas."""
-    from sqlalchemy import func
-    import json
-
-    # ── KPIs principales ────────────────────────────────────
-    total = Evaluacion.query.count()
-
-    if total == 0:
-        return render_template("dashboard.html", vacio=True, total=0)
+# Buckets de score y de DTI del dashboard: (label, lo, hi).
+# Constantes de módulo, no se reconstruyen por request.
+_RANGOS_SCORE = (
+    ("0–19", 0, 19),
+    ("20–39", 20, 39),
+    ("40–59", 40, 59),
+    ("60–79", 60, 79),
+    ("80–100", 80, 100),
+)
+_CATS_DTI = (
+    ("Bajo (<25%)", 0, 0.25),
+    ("Moderado (25–40%)", 0.25, 0.40),
+    ("Alto (40–60%)", 0.40, 0.60),
+    ("Crítico (>60%)", 0.60, 10.0),
+)
 
-    aprobados = Evaluacion.query.filter_by(dictamen="APROBADO").count()
-    rechazados = Evaluacion.query.filter_by(dictamen="RECHAZADO").count()
-    revision = Evaluacion.query.filter_by(dictamen="REVISION_MANUAL").count()
+# Máximo de barras en la gráfica de propósitos
+_TOP_PROPOSITOS = 8
 
-    score_prom = db.session.query(func.avg(Evaluacion.score_final)).scalar() or 0
-    dti_prom = db.session.query(func.avg(Evaluacion.dti_ratio)).scalar() or 0
-    monto_total = db.session.query(func.sum(Evaluacion.monto_credito)).scalar() or 0
 
-    tasa_aprobacion = (aprobados / total * 100) if total > 0 else 0
-
-    kpis = {
-        "total": total,
-        "aprobados": aprobados,
-        "rechazados": rechazados,
-        "revision": revision,
-        "score_promedio": round(score_prom, 1),
-        "dti_promedio": round(dti_prom * 100, 1),
-        "monto_total": round(monto_total, 2),
-        "tasa_aprobacion": round(tasa_aprobacion, 1),
-    }
+def _stats_vigentes() -> EvaluacionStats:
+    """Fila de KPIs materializados, corrigiendo deriva.
 
+    Lee la fila única de EvaluacionStats y la reconstruye solo
+    cuando el conteo real de la tabla difiere (cargas que no
+    pasaron por index() ni por la vía bulk).
+    """
+    stats = db.session.get(EvaluacionStats, 1)
+    vivos = db.session.execute(
+        select(func.count(Evaluacion.id))
+    ).scalar_one()
+    if stats is None or stats.total != vivos:
+        # Deriva detectada: reconstruir desde la tabla
+        stats = EvaluacionStats.recompute()
+    return stats
+
+
+def _datos_graficas(stats: EvaluacionStats) -> dict:
+    """Arma los cuatro dicts de gráficas desde la fila de stats."""
     # ── Distribución de dictámenes (pie chart) ──────────────
     chart_dictamen = {
         "labels": ["Aprobado", "Revisión Manual", "Rechazado"],
-        "data": [aprobados, revision, rechazados],
+        "data": [
+            stats.aprobados, stats.revision, stats.rechazados
+        ],
         "colors": ["#10B981", "#F59E0B", "#EF4444"],
     }
 
     # ── Distribución de scores (histograma) ─────────────────
-    rangos = [
-        ("0–19", 0, 19),
-        ("20–39", 20, 39),
-        ("40–59", 40, 59),
-        ("60–79", 60, 79),
-        ("80–100", 80, 100),
-    ]
-    hist_data = []
-    hist_labels = []
-    hist_colors = []
-    color_map = {0: "#EF4444", 1: "#EF4444", 2: "#F59E0B", 3: "#F59E0B", 4: "#10B981"}
-    for i, (label, lo, hi) in enumerate(rangos):
-        count = Evaluacion.query.filter(
-            Evaluacion.score_final >= lo,
-            Evaluacion.score_final <= hi,
-        ).count()
-        hist_labels.append(label)
-        hist_data.append(count)
-        hist_colors.append(color_map[i])
-
     chart_scores = {
-        "labels": hist_labels,
-        "data": hist_data,
-        "colors": hist_colors,
+        "labels": [r[0] for r in _RANGOS_SCORE],
+        "data": [
+            stats.score_b0, stats.score_b1, stats.score_b2,
+            stats.score_b3, stats.score_b4,
+        ],
+        "colors": [
+            "#EF4444", "#EF4444", "#F59E0B",
+            "#F59E0B", "#10B981",
+        ],
     }
 
     # ── Distribución por propósito (bar chart) ──────────────
-    propositos_q = (
-        db.session.query(
-            Evaluacion.proposito_credito,
-            func.count(Evaluacion.id),
-        )
-        .group_by(Evaluacion.proposito_credito)
-        .order_by(func.count(Evaluacion.id).desc())
-        .all()
-    )
+    # Contadores materializados: sin group-by sobre la tabla.
+    # Solo los top-N propósitos; el resto no cabe en la gráfica.
+    propositos_q = sorted(
+        (stats.propositos or {}).items(),
+        key=lambda kv: kv[1],
+        reverse=True,
+    )[:_TOP_PROPOSITOS]
     chart_proposito = {
         "labels": [p[0] for p in propositos_q],
         "data": [p[1] for p in propositos_q],
     }
 
     # ── Distribución de DTI (categorías) ────────────────────
-    dti_cats = [
-        ("Bajo (<25%)", 0, 0.25),
-        ("Moderado (25–40%)", 0.25, 0.40),
-        ("Alto (40–60%)", 0.40, 0.60),
-        ("Crítico (>60%)", 0.60, 10.0),
-    ]
-    dti_labels = []
-    dti_data = []
-    dti_colors = ["#10B981", "#F59E0B", "#FB923C", "#EF4444"]
-    for label, lo, hi in dti_cats:
-        count = Evaluacion.query.filter(
-            Evaluacion.dti_ratio >= lo,
-            Evaluacion.dti_ratio < hi,
-        ).count()
-        dti_labels.append(label)
-        dti_data.append(count)
-
     chart_dti = {
-        "labels": dti_labels,
-        "data": dti_data,
-        "colors": dti_colors,
+        "labels": [c[0] for c in _CATS_DTI],
+        "data": [
+            stats.dti_b0, stats.dti_b1,
+            stats.dti_b2, stats.dti_b3,
+        ],
+        "colors": ["#10B981", "#F59E0B", "#FB923C", "#EF4444"],
+    }
+
+    return {
+        "chart_dictamen": chart_dictamen,
+        "chart_scores": chart_scores,
+        "chart_proposito": chart_proposito,
+        "chart_dti": chart_dti,
     }
 
+
+@main.route("/api/dashboard/charts")
+def api_dashboard_charts():
+    """Gráficas del dashboard como JSON con revalidación ETag.
+
+    El ETag deriva de los acumuladores de stats: mientras no
+    entren evaluaciones nuevas, el navegador revalida con 304
+    sin re-renderizar el dashboard completo.
+    """
+    stats = _stats_vigentes()
+    etag = hashlib.md5(
+        f"{stats.total}:{stats.sum_score}:{stats.sum_monto}"
+        .encode()
+    ).hexdigest()
+    if request.if_none_match.contains(etag):
+        return "", 304
+
+    payload = cache.get("charts_v1")
+    if payload is None:
+        payload = _datos_graficas(stats)
+        cache.set("charts_v1", payload, timeout=60)
+
+    resp = jsonify(payload)
+    resp.set_etag(etag)
+    return resp
+
+
+@main.route("/dashboard")
+@cache.cached(timeout=300, key_prefix="dashboard_v1")
+def dashboard():
+    """Dashboard con KPIs, gráficas y estadísticas agregadas.
+
+    Lee la fila materializada de EvaluacionStats (O(1) sin
+    importar el tamaño de la tabla); solo recalcula cuando el
+    conteo real difiere (cargas que no pasaron por index()).
+    """
+    stats = _stats_vigentes()
+
+    total = stats.total
+    if total == 0:
+        return render_template("dashboard.html", vacio=True, total=0)
+
+    aprobados = stats.aprobados
+    rechazados = stats.rechazados
+    revision = stats.revision
+
+    kpis = {
+        "total": total,
+        "aprobados": aprobados,
+        "rechazados": rechazados,
+        "revision": revision,
+        "score_promedio": round(stats.sum_score / total, 1),
+        "dti_promedio": round(
+            stats.sum_dti / total * 100, 1
+        ),
+        "monto_total": round(stats.sum_monto, 2),
+        "tasa_aprobacion": round(aprobados / total * 100, 1),
+    }
+
+    graficas = _datos_graficas(stats)
+
     # ── Últimas 5 evaluaciones ──────────────────────────────
     ultimas = (
         Evaluacion.query
+        .options(*_LISTADO_OPTS)
         .order_by(Evaluacion.timestamp.desc())
         .limit(5)
         .all()
@@ -340,11 +507,10 @@ def dashboard():
         vacio=False,
         kpis=kpis,
         total=total,
-        chart_dictamen=json.dumps(chart_dictamen),
-        chart_scores=json.dumps(chart_scores),
-        chart_proposito=json.dumps(chart_proposito),
-        chart_dti=json.dumps(chart_dti),
+        # Dicts crudos: el template los serializa con |tojson,
+        # que usa el encoder de la app y escapa para HTML.
         ultimas=ultimas,
+        **graficas,
     )
 
 
@@ -352,20 +518,36 @@ def dashboard():
 # RUTA: DESCARGAR PDF — REPORTE COMPLETO
 # ════════════════════════════════════════════════════════════
 
+def _pdf_bytes(evaluacion: Evaluacion, tipo: str) -> bytes:
+    """Obtiene los bytes del PDF, cacheados por evaluación.
+
+    Las filas de Evaluacion son inmutables tras el commit, así
+    que los bytes se pueden cachear por (id, tipo) sin riesgo
+    de servir un reporte desactualizado.
+    """
+    clave = f"pdf:{evaluacion.id}:{tipo}"
+    pdf = cache.get(clave)
+    if pdf is None:
+        gen = _get_pdf_gen()
+        generar = (
+            gen.generate_complete_report_bytes
+            if tipo == "completo"
+            else gen.generate_client_report_bytes
+        )
+        pdf = generar(evaluacion.to_dict())
+        cache.set(clave, pdf)
+    return pdf
+
+
 @main.route("/resultado/<int:eval_id>/pdf")
 def descargar_pdf(eval_id):
     """Genera y descarga el PDF completo (auditoría)."""
-    evaluacion = Evaluacion.query.get_or_404(eval_id)
-    datos = evaluacion.to_dict()
-    output_path = (
-        f"reports/exports/evaluacion_{eval_id}_completo.pdf"
-    )
+    evaluacion = _obtener_evaluacion_completa(eval_id)
     try:
-        pdf_path = _pdf_gen.generate_complete_report(
-            datos, output_path
-        )
+        pdf = _pdf_bytes(evaluacion, "completo")
         return send_file(
-            pdf_path,
+            BytesIO(pdf),
+            mimetype="application/pdf",
             as_attachment=True,
             download_name=f"MIHAC_Evaluacion_{eval_id}.pdf",
         )
@@ -385,17 +567,12 @@ def descargar_pdf(eval_id):
 @main.route("/resultado/<int:eval_id>/pdf-cliente")
 def descargar_pdf_cliente(eval_id):
     """Genera y descarga el PDF simplificado (cliente)."""
-    evaluacion = Evaluacion.query.get_or_404(eval_id)
-    datos = evaluacion.to_dict()
-    output_path = (
-        f"reports/exports/evaluacion_{eval_id}_cliente.pdf"
-    )
+    evaluacion = _obtener_evaluacion_completa(eval_id)
     try:
-        pdf_path = _pdf_gen.generate_client_report(
-            datos, output_path
-        )
+        pdf = _pdf_bytes(evaluacion, "cliente")
         return send_file(
-            pdf_path,
+            BytesIO(pdf),
+            mimetype="application/pdf",
             as_attachment=True,
             download_name=f"Resultado_Solicitud_{eval_id}.pdf",
         )
@@ -406,3 +583,77 @@ def descargar_pdf_cliente(eval_id):
             "danger",
         )
         return redirect(url_for("main.resultado", eval_id=eval_id))
+
+
+# ════════════════════════════════════════════════════════════
+# INGESTA MASIVA (CLI)
+# ════════════════════════════════════════════════════════════
+
+# Conversión de columnas CSV a los tipos del motor
+_CAMPOS_NUMERICOS = {
+    "edad": int,
+    "ingreso_mensual": float,
+    "total_deuda_actual": float,
+    "historial_crediticio": int,
+    "antiguedad_laboral": int,
+    "numero_dependientes": int,
+    "monto_credito": float,
+}
+
+
+def bulk_evaluate(datos_list: list[dict]) -> int:
+    """Evalúa un lote y lo persiste en un solo INSERT multi-fila.
+
+    Evita el antipatrón add+commit por fila: el motor puntúa
+    cada entrada, las filas se insertan por la vía Core
+    (Evaluacion.bulk_insert) con un único commit, y los KPIs
+    materializados se reconstruyen una sola vez al final.
+
+    Args:
+        datos_list: Lista de dicts con las 9 variables de
+            entrada del motor.
+
+    Returns:
+        Número de evaluaciones insertadas (las entradas con
+        errores de validación se omiten).
+    """
+    if not datos_list:
+        return 0
+
+    engine = _get_engine()
+    filas = []
+    for datos in datos_list:
+        resultado = engine.evaluate(datos)
+        if resultado.get("errores_validacion"):
+            continue
+        filas.append(
+            Evaluacion.mapping_from_inference(datos, resultado)
+        )
+
+    Evaluacion.bulk_insert(filas)
+    EvaluacionStats.recompute()
+    cache.delete("dashboard_v1")
+    cache.delete("charts_v1")
+    return len(filas)
+
+
+@main.cli.command("evaluar-lote")
+@click.argument("csv_path")
+def evaluar_lote(csv_path):
+    """Evalúa un CSV de solicitudes por la vía bulk.
+
+    Uso:  flask main evaluar-lote solicitudes.csv
+
+    El CSV debe traer las 9 columnas de entrada del motor
+    (edad, ingreso_mensual, ..., monto_credito).
+    """
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        datos_list = [
+            {
+                campo: _CAMPOS_NUMERICOS.get(campo, str)(valor)
+                for campo, valor in fila.items()
+            }
+            for fila in csv.DictReader(f)
+        ]
+    n = bulk_evaluate(datos_list)
+    click.echo(f"{n} evaluaciones insertadas")
@@ -7,7 +7,9 @@
 # ============================================================
 
 import os
+import sys
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 
 # ────────────────────────────────────────────────────────────
@@ -45,6 +47,13 @@ UMBRAL_APROBADO = 80          # Score >= 80 → APROBADO
 UMBRAL_REVISION = 60          # Score >= 60 y < 80 → REVISIÓN MANUAL
 # Score < 60 → RECHAZADO (implícito)
 
+# Constantes internadas del dictamen: todos los módulos deben
+# devolver/comparar estos mismos objetos para que los lookups por
+# hash sean contra la cadena ya internada.
+DICTAMEN_APROBADO = sys.intern("APROBADO")
+DICTAMEN_RECHAZADO = sys.intern("RECHAZADO")
+DICTAMEN_REVISION = sys.intern("REVISION_MANUAL")
+
 SCORE_MINIMO = 0
 SCORE_MAXIMO = 100
 SCORE_BASE_INICIAL = 50       # Punto de partida neutral del scoring
@@ -77,15 +86,21 @@ HISTORIAL_VALORES = {
     2: "Bueno",
 }
 
-TIPOS_VIVIENDA = ["Propia", "Familiar", "Rentada"]
+TIPOS_VIVIENDA = ("Propia", "Familiar", "Rentada")
 
-PROPOSITOS_CREDITO = [
+PROPOSITOS_CREDITO = (
     "Negocio",
     "Educacion",
     "Consumo",
     "Emergencia",
     "Vacaciones",
-]
+)
+
+# Variantes para el camino caliente: frozenset para membresía
+# O(1) en el validador y el formulario web. Las tuplas ordenadas
+# de arriba siguen siendo la fuente para selects de UI.
+TIPOS_VIVIENDA_SET = frozenset(TIPOS_VIVIENDA)
+PROPOSITOS_CREDITO_SET = frozenset(PROPOSITOS_CREDITO)
 
 # ────────────────────────────────────────────────────────────
 # 7. DTI (Debt-To-Income)
@@ -146,7 +161,45 @@ def setup_logging() -> None:
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 # ────────────────────────────────────────────────────────────
-# 12. METADATOS DEL PROYECTO
+# 12. SNAPSHOT INMUTABLE PARA EL CAMINO CALIENTE
+# ────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class MihacConfig:
+    """Snapshot congelado de los umbrales del motor.
+
+    Los módulos del núcleo (scorer, validator) leen estos
+    valores en cada evaluación; con frozen + slots el acceso a
+    atributo es una lectura a nivel C sin lookup de dict y el
+    snapshot no puede mutarse en caliente. Se instancia una
+    sola vez al importar config.
+    """
+
+    # Umbrales de dictamen
+    umbral_aprobado: int = UMBRAL_APROBADO
+    umbral_monto_alto: int = 85
+    monto_umbral_alto: float = 20_000.0
+    margen_revision: int = 20
+
+    # Clampeo del score
+    score_minimo: int = SCORE_MINIMO
+    score_maximo: int = SCORE_MAXIMO
+
+    # Cortes de clasificación DTI
+    dti_bajo: float = 0.25
+    dti_moderado: float = 0.40
+    dti_alto: float = 0.60
+
+    # Base de conocimiento
+    rules_file: Path = RULES_FILE
+
+
+# Instancia única construida al importar el módulo
+CONFIG = MihacConfig()
+
+
+# ────────────────────────────────────────────────────────────
+# 13. METADATOS DEL PROYECTO
 # ────────────────────────────────────────────────────────────
 PROJECT_NAME = "MIHAC"
 PROJECT_VERSION = "1.0.0"
@@ -0,0 +1,46 @@
+# ============================================================
+# MIHAC v1.0 — Carga de la Base de Conocimiento
+# core/config_io.py
+# ============================================================
+# Lectura de los archivos JSON de knowledge/ (rules.json,
+# weights.json, thresholds.json) con orjson y caché por mtime:
+# cada archivo se parsea exactamente una vez mientras no cambie
+# en disco.
+# ============================================================
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def load_json(path: str | Path) -> Any:
+    """Carga un archivo JSON de la base de conocimiento.
+
+    Usa orjson (parser en C) sobre los bytes crudos y cachea el
+    resultado por (ruta, mtime_ns): recargas en caliente de un
+    archivo sin cambios son un lookup O(1).
+
+    Args:
+        path: Ruta al archivo JSON.
+
+    Returns:
+        El contenido deserializado (dict/list).
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        orjson.JSONDecodeError: Si el JSON es inválido.
+    """
+    ruta = Path(path)
+    return _load_json_cached(ruta, ruta.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _load_json_cached(ruta: Path, _mtime_ns: int) -> Any:
+    """Parsea el archivo; el mtime en la clave invalida solo."""
+    logger.info("Parseando JSON de conocimiento: %s", ruta)
+    return orjson.loads(ruta.read_bytes())
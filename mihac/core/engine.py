@@ -7,20 +7,43 @@
 # explicación, y retorna el resultado completo.
 # ============================================================
 
+import atexit
+import copy
+import os
+import queue
 import sys
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from datetime import datetime
+from types import MappingProxyType
 
-# Asegurar que el proyecto raíz esté en sys.path
-_CORE_DIR = Path(__file__).resolve().parent
-_PROJECT_ROOT = _CORE_DIR.parent
-if str(_PROJECT_ROOT) not in sys.path:
+import numpy as np
+
+# Raíz del proyecto, sin resolve(): __file__ ya es absoluto y
+# así se evita la caminata de stat por symlinks en cada import.
+_PROJECT_ROOT = Path(__file__).parent.parent
+
+try:
+    from core.validator import Validator
+    from core.scorer import ScoringEngine
+    from core.explainer import Explainer
+except ImportError:
+    # Ejecución directa del módulo: la raíz aún no está en
+    # sys.path; insertarla una sola vez y reintentar.
     sys.path.insert(0, str(_PROJECT_ROOT))
+    from core.validator import Validator
+    from core.scorer import ScoringEngine
+    from core.explainer import Explainer
 
-from core.validator import Validator
-from core.scorer import ScoringEngine
-from core.explainer import Explainer
+from config import (  # noqa: E402
+    DICTAMEN_APROBADO,
+    DICTAMEN_RECHAZADO,
+    DICTAMEN_REVISION,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,25 +74,96 @@ class InferenceEngine:
         print(resultado["score_final"])
     """
 
+    # Tamaño máximo de la caché de resultados memoizados
+    _CACHE_MAX = 4096
+
+    # El hilo del log vuelca a disco al juntar este tamaño
+    # de lote o tras ~50 ms sin líneas nuevas
+    _LOG_LOTE_BYTES = 4096
+    _LOG_ESPERA_SEG = 0.05
+
+    # Lotes de este tamaño o más se reparten entre procesos
+    _BATCH_PARALELO_MIN = 256
+
+    # Timestamp del log cacheado a resolución de segundo:
+    # strftime solo se paga cuando cambia el segundo entero.
+    _last_ts_int: int = 0
+    _last_ts_str: str = ""
+
+    # Índice de cada dictamen en el arreglo de contadores,
+    # clavado por las mismas constantes internadas que devuelve
+    # el scorer.
+    _DICTAMEN_IDX = {
+        DICTAMEN_APROBADO: 0,
+        DICTAMEN_RECHAZADO: 1,
+        DICTAMEN_REVISION: 2,
+    }
+
     def __init__(self) -> None:
         """Inicializa los componentes del motor."""
         self._validator = Validator()
         self._scorer = ScoringEngine()
-        self._explainer = Explainer()
+
+        # El Explainer carga sus plantillas de texto; se difiere
+        # hasta la primera evaluación que pida explicación (ver
+        # propiedad explainer).
+        self._explainer: Explainer | None = None
+
+        # Caché LRU de resultados por perfil sanitizado:
+        # entradas idénticas (reintentos web, lotes con
+        # duplicados) no repiten scoring ni explicación.
+        self._result_cache: OrderedDict[tuple, dict] = (
+            OrderedDict()
+        )
+
+        # Log asíncrono: evaluate() solo formatea y encola; un
+        # hilo daemon drena la cola y escribe en lotes, sacando
+        # la E/S de disco del camino crítico. atexit garantiza
+        # el volcado final al cerrar el intérprete.
+        self._log_fh = None
+        self._log_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_lock = threading.Lock()
+        try:
+            self._log_fh = open(
+                _PROJECT_ROOT / "mihac_evaluations.log",
+                "a",
+                buffering=1 << 16,
+                encoding="utf-8",
+            )
+            threading.Thread(
+                target=self._log_drain, daemon=True
+            ).start()
+            atexit.register(self._cerrar_log)
+        except OSError as e:
+            logger.warning(
+                "No se pudo abrir el log de evaluaciones: %s",
+                e,
+            )
 
         # Estadísticas de sesión
         self._total_evaluaciones: int = 0
-        self._aprobados: int = 0
-        self._rechazados: int = 0
-        self._revision_manual: int = 0
+        self._counts = np.zeros(3, dtype=np.int64)
         self._suma_scores: float = 0.0
         self._suma_dti: float = 0.0
 
+        # Vista memoizada de stats; se invalida en cada
+        # _actualizar_stats y se recalcula solo al leerla.
+        self._stats_cache: MappingProxyType | None = None
+
+    @property
+    def explainer(self) -> Explainer:
+        """Explainer construido perezosamente al primer uso."""
+        if self._explainer is None:
+            self._explainer = Explainer()
+        return self._explainer
+
     # ────────────────────────────────────────────────────────
     # MÉTODO PRINCIPAL
     # ────────────────────────────────────────────────────────
 
-    def evaluate(self, datos: dict) -> dict:
+    def evaluate(
+        self, datos: dict, explain: bool = True
+    ) -> dict:
         """Evalúa una solicitud de crédito completa.
 
         Ejecuta el flujo de 9 pasos. Nunca lanza excepciones
@@ -79,6 +173,9 @@ class InferenceEngine:
         Args:
             datos: Diccionario con datos crudos del
                 solicitante (ver diccionario de datos).
+            explain: Si es False se omite el paso 7 y
+                reporte_explicacion queda vacío; útil cuando
+                solo interesa el score.
 
         Returns:
             Dict con la estructura de salida completa:
@@ -110,79 +207,197 @@ class InferenceEngine:
                 datos_limpios["total_deuda_actual"],
             )
 
-            # Paso 4 — Sub-scores
-            sub_scores = self._scorer.calculate_subscores(
-                datos_limpios, dti
+            # Pasos 4–9 (memoizados por perfil)
+            return self._evaluar_memoizado(
+                datos_limpios, dti, dti_clasif, explain
             )
 
-            # Paso 5 — Reglas heurísticas
-            reglas = self._scorer.apply_rules(
-                datos_limpios, dti
+        except Exception as e:
+            logger.error("Error interno en evaluate: %s", e)
+            return self._resultado_con_errores(
+                [f"Error interno: {e}"]
             )
 
-            # Paso 6 — Score final y dictamen
-            score, umbral = (
-                self._scorer.calculate_final_score(
-                    sub_scores,
-                    reglas,
-                    datos_limpios["monto_credito"],
-                )
-            )
-            dictamen = self._scorer.get_dictamen(
-                score, umbral, dti_clasif
-            )
+    def explain_result(
+        self, datos: dict, resultado: dict
+    ) -> str:
+        """Genera bajo demanda la explicación de un resultado.
 
-            # Separar compensaciones
-            compensaciones = [
-                r for r in reglas
-                if r["tipo"] == "compensacion"
-            ]
+        Complemento de los lotes evaluados sin explicación: el
+        caller que quiere el texto de una fila concreta lo pide
+        después, sin pagar el costo O(N) durante el lote.
 
-            # Construir resultado parcial
-            resultado = {
-                "score_final": score,
-                "dti_ratio": dti,
-                "dti_clasificacion": dti_clasif,
-                "sub_scores": sub_scores,
-                "dictamen": dictamen,
-                "umbral_aplicado": umbral,
-                "reglas_activadas": reglas,
-                "compensaciones": compensaciones,
-                "errores_validacion": [],
-            }
+        Args:
+            datos: Datos crudos del solicitante de esa fila.
+            resultado: Resultado devuelto por evaluate /
+                evaluate_batch para la misma fila.
+
+        Returns:
+            El reporte en lenguaje natural.
+        """
+        datos_limpios = self._validator.sanitize(datos)
+        return self.explainer.generate(
+            datos_limpios, resultado
+        )
 
-            # Paso 7 — Explicación en lenguaje natural
-            explicacion = self._explainer.generate(
-                datos_limpios, resultado
+    def _evaluar_memoizado(
+        self,
+        datos_limpios: dict,
+        dti: float,
+        dti_clasif: str,
+        explain: bool = True,
+        sub_scores: dict | None = None,
+        grupos: dict | None = None,
+    ) -> dict:
+        """Pasos 4–9 con caché LRU por perfil sanitizado.
+
+        La clave es la tupla ordenada de los datos limpios
+        (solo escalares tras sanitize) más el flag explain:
+        un resultado sin explicación no debe servir a un caller
+        que sí la pide. En hit se devuelve una copia profunda —
+        los callers mutan "indice" y no deben envenenar la
+        caché — y el log y las estadísticas de sesión sí se
+        actualizan por llamada. sub_scores y grupos permiten a
+        la vía por lotes inyectar lo ya vectorizado.
+        """
+        try:
+            clave = (
+                explain,
+                tuple(sorted(datos_limpios.items())),
+            )
+        except TypeError:
+            # Valor no hashable/ordenable: sin memoización
+            return self._evaluar_limpio(
+                datos_limpios, dti, dti_clasif, explain,
+                sub_scores, grupos,
             )
-            resultado["reporte_explicacion"] = explicacion
 
-            # Paso 8 — Log
+        cacheado = self._result_cache.get(clave)
+        if cacheado is not None:
+            self._result_cache.move_to_end(clave)
+            resultado = copy.deepcopy(cacheado)
             self._log_evaluation(datos_limpios, resultado)
-
-            # Paso 9 — Actualizar stats y retornar
             self._actualizar_stats(resultado)
-
             return resultado
 
-        except Exception as e:
-            logger.error("Error interno en evaluate: %s", e)
-            return self._resultado_con_errores(
-                [f"Error interno: {e}"]
+        resultado = self._evaluar_limpio(
+            datos_limpios, dti, dti_clasif, explain,
+            sub_scores, grupos,
+        )
+        self._result_cache[clave] = copy.deepcopy(resultado)
+        if len(self._result_cache) > self._CACHE_MAX:
+            self._result_cache.popitem(last=False)
+        return resultado
+
+    def _evaluar_limpio(
+        self,
+        datos_limpios: dict,
+        dti: float,
+        dti_clasif: str,
+        explain: bool = True,
+        sub_scores: dict | None = None,
+        grupos: dict | None = None,
+    ) -> dict:
+        """Ejecuta los pasos 4–9 sobre datos ya validados.
+
+        Separado de evaluate() para que la vía por lotes pueda
+        inyectar el DTI, los sub-scores y los grupos de reglas
+        precalculados de forma vectorizada.
+
+        Args:
+            datos_limpios: Datos ya sanitizados y válidos.
+            dti: Ratio DTI del registro.
+            dti_clasif: Clasificación del DTI.
+            explain: Si es False se omite la explicación.
+            sub_scores: Sub-scores ya calculados para la fila
+                (vía vectorizada); None los calcula aquí.
+            grupos: Grupos de reglas de apply_rules_batch para
+                la fila; None evalúa las reglas aquí.
+
+        Returns:
+            Dict con la estructura de salida completa.
+        """
+        # Paso 4 — Sub-scores (salvo que el lote los traiga)
+        if sub_scores is None:
+            sub_scores = self._scorer.calculate_subscores(
+                datos_limpios, dti
+            )
+
+        # Paso 5 — Reglas heurísticas (ya separadas por tipo,
+        # salvo que el lote traiga los grupos vectorizados)
+        if grupos is None:
+            grupos = self._scorer.apply_rules_bucketed(
+                datos_limpios, dti
             )
+        compensaciones = grupos["compensaciones"]
+        reglas = grupos["directas"] + compensaciones
+
+        # Paso 6 — Score final y dictamen
+        score, umbral = (
+            self._scorer.calculate_final_score(
+                sub_scores,
+                grupos,
+                datos_limpios["monto_credito"],
+            )
+        )
+        dictamen = self._scorer.get_dictamen(
+            score, umbral, dti_clasif
+        )
+
+        # Construir resultado parcial
+        resultado = {
+            "score_final": score,
+            "dti_ratio": dti,
+            "dti_clasificacion": dti_clasif,
+            "sub_scores": sub_scores,
+            "dictamen": dictamen,
+            "umbral_aplicado": umbral,
+            "reglas_activadas": reglas,
+            "compensaciones": compensaciones,
+            "errores_validacion": [],
+        }
+
+        # Paso 7 — Explicación en lenguaje natural (opcional)
+        if explain:
+            resultado["reporte_explicacion"] = (
+                self.explainer.generate(
+                    datos_limpios, resultado
+                )
+            )
+        else:
+            resultado["reporte_explicacion"] = ""
+
+        # Paso 8 — Log
+        self._log_evaluation(datos_limpios, resultado)
+
+        # Paso 9 — Actualizar stats y retornar
+        self._actualizar_stats(resultado)
+
+        return resultado
 
     # ────────────────────────────────────────────────────────
     # EVALUACIÓN POR LOTES
     # ────────────────────────────────────────────────────────
 
     def evaluate_batch(
-        self, lista_datos: list[dict]
+        self,
+        lista_datos: list[dict],
+        explain: bool = False,
+        explain_indices: set[int] | None = None,
     ) -> list[dict]:
         """Evalúa una lista de solicitantes.
 
         Args:
             lista_datos: Lista de dicts con datos de
                 cada solicitante.
+            explain: Si es True genera también el reporte en
+                lenguaje natural por fila; apagado por defecto
+                en modo lote, donde suele descartarse.
+            explain_indices: Índices del lote que sí reciben
+                explicación (p. ej. las primeras filas para un
+                preview de UI); si se da, tiene prioridad sobre
+                explain. El resto puede explicarse después con
+                explain_result().
 
         Returns:
             Lista de resultados en el mismo orden.
@@ -197,18 +412,207 @@ class InferenceEngine:
         """
         resultados: list[dict] = []
         total = len(lista_datos)
+        if total == 0:
+            return resultados
+
+        logger.info("Evaluando lote de %d solicitudes...", total)
 
-        for i, datos in enumerate(lista_datos):
-            logger.info(
-                "Evaluando solicitud %d de %d...",
-                i + 1, total,
+        # Lotes grandes: validación y explicación son CPU puro
+        # de Python (GIL-bound), así que se reparten por chunks
+        # entre procesos hijos.
+        if total >= self._BATCH_PARALELO_MIN:
+            return self._evaluate_batch_paralelo(
+                lista_datos, explain, explain_indices
             )
-            resultado = self.evaluate(datos)
+
+        # Pasos 1–2 por registro: sanitización y validación
+        # producen errores individuales y son baratas.
+        limpios: list[tuple[dict, list[str] | None]] = []
+        for datos in lista_datos:
+            try:
+                datos_limpios = self._validator.sanitize(datos)
+                valido, errores = self._validator.validate(
+                    datos_limpios
+                )
+                limpios.append(
+                    (datos_limpios,
+                     None if valido else errores)
+                )
+            except Exception as e:
+                limpios.append(
+                    ({}, [f"Error interno: {e}"])
+                )
+
+        # Paso 3 vectorizado: el DTI de todo el lote se calcula
+        # en un solo pase NumPy sobre columnas contiguas (SoA).
+        columnas = self._stack_batch(
+            [dl for dl, _ in limpios]
+        )
+        dtis, clasifs = self._scorer.calculate_dti_vec(
+            columnas["ingreso_mensual"],
+            columnas["total_deuda_actual"],
+        )
+
+        # Paso 4 vectorizado: los 4 sub-scores del lote entero
+        # en arrays int64; cada fila toma luego su rebanada.
+        subs_vec = self._scorer.calculate_subscores_vec(
+            columnas, dtis
+        )
+
+        # Paso 5 vectorizado: una máscara NumPy por regla sobre
+        # el lote completo; cada fila recibe sus grupos ya
+        # construidos (con impacto_total acumulado).
+        grupos_lote = self._scorer.apply_rules_batch(
+            columnas, dtis
+        )
+
+        # Pasos 6–9 por registro: dictamen y explicación
+        # producen escalares/texto por fila.
+        for i, (datos_limpios, errores) in enumerate(limpios):
+            if errores is not None:
+                resultado = self._resultado_con_errores(
+                    errores
+                )
+            else:
+                try:
+                    resultado = self._evaluar_memoizado(
+                        datos_limpios,
+                        float(dtis[i]),
+                        str(clasifs[i]),
+                        (i in explain_indices
+                         if explain_indices is not None
+                         else explain),
+                        sub_scores={
+                            k: int(v[i])
+                            for k, v in subs_vec.items()
+                        },
+                        grupos=grupos_lote[i],
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Error interno en lote: %s", e
+                    )
+                    resultado = self._resultado_con_errores(
+                        [f"Error interno: {e}"]
+                    )
             resultado["indice"] = i
             resultados.append(resultado)
 
         return resultados
 
+    def _evaluate_batch_paralelo(
+        self,
+        lista_datos: list[dict],
+        explain: bool = False,
+        explain_indices: set[int] | None = None,
+    ) -> list[dict]:
+        """Evalúa un lote grande repartido entre procesos.
+
+        Cada proceso hijo construye su propio motor una sola vez
+        (ver _engine_proceso) y evalúa un chunk completo; el
+        padre conserva el orden, renumera 'indice' y acumula las
+        estadísticas de sesión.
+
+        Args:
+            lista_datos: Lista de dicts con datos de cada
+                solicitante.
+            explain: Genera la explicación para todas las filas.
+            explain_indices: Índices absolutos del lote con
+                explicación; tiene prioridad sobre explain.
+
+        Returns:
+            Lista de resultados en el mismo orden.
+        """
+        n_proc = os.cpu_count() or 1
+        tam = max(64, len(lista_datos) // (n_proc * 4))
+        offsets = range(0, len(lista_datos), tam)
+        chunks = [
+            lista_datos[i:i + tam] for i in offsets
+        ]
+        # Índices relativos a cada chunk
+        if explain_indices is not None:
+            indices_rel = [
+                {j - off for j in explain_indices
+                 if off <= j < off + tam}
+                for off in offsets
+            ]
+        else:
+            indices_rel = [None] * len(chunks)
+
+        # Vaciar el búfer del log antes del fork para que los
+        # hijos no hereden (y dupliquen) líneas pendientes.
+        self.flush_log()
+
+        resultados: list[dict] = []
+        trabajo = partial(_evaluar_chunk, explain=explain)
+        with ProcessPoolExecutor(max_workers=n_proc) as pool:
+            for parcial in pool.map(
+                trabajo, chunks, indices_rel
+            ):
+                resultados.extend(parcial)
+
+        for i, resultado in enumerate(resultados):
+            resultado["indice"] = i
+            self._actualizar_stats(resultado)
+
+        return resultados
+
+    # Campos que consumen las vías vectorizadas del scorer
+    # (DTI, sub-scores, reglas): numéricos como float64 y
+    # categóricos como object (cadenas).
+    _CAMPOS_NUM_BATCH = (
+        "edad", "ingreso_mensual", "total_deuda_actual",
+        "historial_crediticio", "antiguedad_laboral",
+        "numero_dependientes", "monto_credito",
+    )
+    _CAMPOS_CAT_BATCH = (
+        "tipo_vivienda", "proposito_credito",
+    )
+
+    @classmethod
+    def _stack_batch(
+        cls,
+        lista_datos: list[dict],
+    ) -> dict[str, "np.ndarray"]:
+        """Apila los campos del lote en arrays SoA.
+
+        Los valores que no son numéricos/cadena (filas que no
+        pasaron la validación) caen al default del campo; esas
+        filas reciben igualmente su resultado de error y nunca
+        leen lo vectorizado.
+
+        Args:
+            lista_datos: Lista de dicts ya sanitizados.
+
+        Returns:
+            Dict campo → array contiguo del lote.
+        """
+        n = len(lista_datos)
+        columnas = {
+            campo: np.fromiter(
+                (
+                    v if isinstance(v, (int, float)) else 0
+                    for v in (
+                        d.get(campo) for d in lista_datos
+                    )
+                ),
+                dtype=np.float64,
+                count=n,
+            )
+            for campo in cls._CAMPOS_NUM_BATCH
+        }
+        for campo in cls._CAMPOS_CAT_BATCH:
+            columnas[campo] = np.array(
+                [
+                    v if isinstance(v, str) else ""
+                    for v in (
+                        d.get(campo) for d in lista_datos
+                    )
+                ],
+                dtype=object,
+            )
+        return columnas
+
     # ────────────────────────────────────────────────────────
     # LOG DE EVALUACIÓN
     # ────────────────────────────────────────────────────────
@@ -225,39 +629,117 @@ class InferenceEngine:
             datos: Datos del solicitante.
             resultado: Resultado de la evaluación.
         """
+        if self._log_fh is None:
+            return
         try:
-            log_path = _PROJECT_ROOT / "mihac_evaluations.log"
-            timestamp = datetime.now().strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-            dictamen = resultado.get("dictamen", "N/A")
-            score = resultado.get("score_final", 0)
-            dti = resultado.get("dti_ratio", 0.0)
-            monto = datos.get("monto_credito", 0)
-            proposito = datos.get(
-                "proposito_credito", "N/A"
-            )
+            ahora = int(time.time())
+            if ahora != self._last_ts_int:
+                self._last_ts_int = ahora
+                self._last_ts_str = time.strftime(
+                    "%Y-%m-%d %H:%M:%S",
+                    time.localtime(ahora),
+                )
+
+            # join sobre campos pre-convertidos: más barato
+            # que f-strings anidados en el camino caliente.
+            # Indexado directo: los campos siempre existen tras
+            # la validación, y el try de este método ya absorbe
+            # un KeyError excepcional sin pagar defaults por
+            # campo en el caso común.
+            linea = "".join((
+                "[", self._last_ts_str, "] | ",
+                resultado["dictamen"], " | ",
+                str(resultado["score_final"]), " | ",
+                format(resultado["dti_ratio"], ".2f"),
+                " | ",
+                str(datos["monto_credito"]), " | ",
+                datos["proposito_credito"], "\n",
+            ))
+
+            self._log_q.put(linea)
 
-            linea = (
-                f"[{timestamp}] | {dictamen} | "
-                f"{score} | {dti:.2f} | "
-                f"{monto} | {proposito}\n"
+        except Exception as e:
+            logger.warning(
+                "Error al escribir log de evaluación: %s", e
             )
 
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(linea)
+    def _log_drain(self) -> None:
+        """Bucle del hilo daemon que drena la cola del log.
 
+        Acumula líneas hasta _LOG_LOTE_BYTES o hasta que pasen
+        _LOG_ESPERA_SEG sin tráfico, y entonces escribe el lote
+        completo de una vez. Un threading.Event encolado por
+        flush_log() fuerza el volcado inmediato y se señala al
+        terminar.
+        """
+        pendientes: list[str] = []
+        acumulado = 0
+        while True:
+            try:
+                item = self._log_q.get(
+                    timeout=self._LOG_ESPERA_SEG
+                )
+            except queue.Empty:
+                if pendientes:
+                    self._escribir_lote(pendientes)
+                    pendientes = []
+                    acumulado = 0
+                continue
+
+            if isinstance(item, threading.Event):
+                self._escribir_lote(pendientes)
+                pendientes = []
+                acumulado = 0
+                item.set()
+                continue
+
+            pendientes.append(item)
+            acumulado += len(item)
+            if acumulado >= self._LOG_LOTE_BYTES:
+                self._escribir_lote(pendientes)
+                pendientes = []
+                acumulado = 0
+
+    def _escribir_lote(self, lineas: list[str]) -> None:
+        """Escribe un lote de líneas y lo baja a disco."""
+        if self._log_fh is None:
+            return
+        try:
+            with self._log_lock:
+                if lineas:
+                    self._log_fh.write("".join(lineas))
+                self._log_fh.flush()
         except Exception as e:
             logger.warning(
-                "Error al escribir log de evaluación: %s", e
+                "Error al volcar el log de evaluaciones: %s", e
             )
 
+    def flush_log(self) -> None:
+        """Vuelca las líneas pendientes del log a disco.
+
+        Bloquea hasta que el hilo del log haya escrito todo lo
+        encolado; útil al terminar un lote o antes de leer el
+        archivo. El cierre del intérprete lo hace vía atexit.
+        """
+        if self._log_fh is None:
+            return
+        listo = threading.Event()
+        self._log_q.put(listo)
+        listo.wait(timeout=2.0)
+
+    def _cerrar_log(self) -> None:
+        """Drena y cierra el log al terminar el proceso."""
+        self.flush_log()
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+
     # ────────────────────────────────────────────────────────
     # ESTADÍSTICAS DE SESIÓN
     # ────────────────────────────────────────────────────────
 
     @property
-    def stats(self) -> dict:
+    def stats(self) -> MappingProxyType:
         """Estadísticas acumuladas de la sesión.
 
         Returns:
@@ -265,13 +747,25 @@ class InferenceEngine:
             rechazados, revision_manual, tasa_aprobacion,
             score_promedio, dti_promedio.
 
+        La vista devuelta es de solo lectura y se memoiza hasta
+        la próxima evaluación: leer stats en cada request del
+        dashboard no repite divisiones ni redondeos.
+
+        Returns:
+            Vista de solo lectura con total_evaluaciones,
+            aprobados, rechazados, revision_manual,
+            tasa_aprobacion, score_promedio, dti_promedio.
+
         Ejemplo::
 
             print(engine.stats["tasa_aprobacion"])
         """
+        if self._stats_cache is not None:
+            return self._stats_cache
+
         total = self._total_evaluaciones
         if total == 0:
-            return {
+            datos = {
                 "total_evaluaciones": 0,
                 "aprobados": 0,
                 "rechazados": 0,
@@ -280,72 +774,128 @@ class InferenceEngine:
                 "score_promedio": 0.0,
                 "dti_promedio": 0.0,
             }
+        else:
+            aprobados = int(self._counts[0])
+            datos = {
+                "total_evaluaciones": total,
+                "aprobados": aprobados,
+                "rechazados": int(self._counts[1]),
+                "revision_manual": int(self._counts[2]),
+                "tasa_aprobacion": round(
+                    aprobados / total * 100, 2
+                ),
+                "score_promedio": round(
+                    self._suma_scores / total, 2
+                ),
+                "dti_promedio": round(
+                    self._suma_dti / total, 4
+                ),
+            }
 
-        return {
-            "total_evaluaciones": total,
-            "aprobados": self._aprobados,
-            "rechazados": self._rechazados,
-            "revision_manual": self._revision_manual,
-            "tasa_aprobacion": round(
-                self._aprobados / total * 100, 2
-            ),
-            "score_promedio": round(
-                self._suma_scores / total, 2
-            ),
-            "dti_promedio": round(
-                self._suma_dti / total, 4
-            ),
-        }
+        self._stats_cache = MappingProxyType(datos)
+        return self._stats_cache
 
     def _actualizar_stats(self, resultado: dict) -> None:
-        """Actualiza contadores de la sesión."""
+        """Actualiza contadores de la sesión.
+
+        Los campos score_final/dti_ratio/dictamen siempre están
+        presentes (ver _resultado_con_errores), por lo que se
+        indexan directo sin .get y el dictamen se clasifica con
+        una sola búsqueda en _DICTAMEN_IDX en lugar del if/elif
+        encadenado.
+        """
         self._total_evaluaciones += 1
-        self._suma_scores += resultado.get(
-            "score_final", 0
-        )
-        self._suma_dti += resultado.get("dti_ratio", 0.0)
+        self._suma_scores += resultado["score_final"]
+        self._suma_dti += resultado["dti_ratio"]
 
-        dictamen = resultado.get("dictamen", "")
-        if dictamen == "APROBADO":
-            self._aprobados += 1
-        elif dictamen == "RECHAZADO":
-            self._rechazados += 1
-        elif dictamen == "REVISION_MANUAL":
-            self._revision_manual += 1
+        idx = self._DICTAMEN_IDX.get(resultado["dictamen"], -1)
+        if idx >= 0:
+            self._counts[idx] += 1
+
+        self._stats_cache = None
 
     # ────────────────────────────────────────────────────────
     # RESULTADO CON ERRORES
     # ────────────────────────────────────────────────────────
 
+    # Plantilla inmutable del resultado de error: copiarla es más
+    # barato que reconstruir el dict literal en cada fila sucia.
+    _ERROR_TEMPLATE = MappingProxyType({
+        "score_final": 0,
+        "dti_ratio": 0.0,
+        "dti_clasificacion": "N/A",
+        "sub_scores": MappingProxyType({
+            "solvencia": 0,
+            "estabilidad": 0,
+            "historial_score": 0,
+            "perfil": 0,
+        }),
+        "dictamen": DICTAMEN_RECHAZADO,
+        "umbral_aplicado": 80,
+        "reporte_explicacion": "",
+    })
+
     @staticmethod
     def _resultado_con_errores(
         errores: list[str],
     ) -> dict:
         """Construye un resultado de error sin score.
 
+        Clona la plantilla congelada y solo materializa los
+        campos mutables (sub_scores, listas de reglas y errores)
+        para no compartir estado entre filas.
+
         Args:
             errores: Lista de mensajes de error.
 
         Returns:
             Dict con estructura de salida y errores.
         """
-        return {
-            "score_final": 0,
-            "dti_ratio": 0.0,
-            "dti_clasificacion": "N/A",
-            "sub_scores": {
-                "solvencia": 0,
-                "estabilidad": 0,
-                "historial_score": 0,
-                "perfil": 0,
-            },
-            "dictamen": "RECHAZADO",
-            "umbral_aplicado": 80,
-            "reglas_activadas": [],
-            "compensaciones": [],
-            "reporte_explicacion": "",
-            "errores_validacion": errores,
-        }
+        out = dict(InferenceEngine._ERROR_TEMPLATE)
+        out["sub_scores"] = dict(
+            InferenceEngine._ERROR_TEMPLATE["sub_scores"]
+        )
+        out["reglas_activadas"] = []
+        out["compensaciones"] = []
+        out["errores_validacion"] = errores
+        return out
+
+
+# ════════════════════════════════════════════════════════════
+# WORKERS DE LOTES PARALELOS
+# ════════════════════════════════════════════════════════════
+
+@lru_cache(maxsize=1)
+def _engine_proceso() -> InferenceEngine:
+    """Motor singleton del proceso hijo.
+
+    Se construye una sola vez por worker, no una vez por chunk.
+    """
+    return InferenceEngine()
+
+
+def _evaluar_chunk(
+    chunk: list[dict],
+    explain_indices: set[int] | None = None,
+    explain: bool = False,
+) -> list[dict]:
+    """Evalúa un chunk completo dentro de un proceso hijo.
+
+    Args:
+        chunk: Filas del lote asignadas a este worker.
+        explain_indices: Índices relativos al chunk que llevan
+            explicación; tiene prioridad sobre explain.
+        explain: Genera la explicación para todo el chunk.
+    """
+    motor = _engine_proceso()
+    if explain_indices is not None:
+        return [
+            motor.evaluate(datos, i in explain_indices)
+            for i, datos in enumerate(chunk)
+        ]
+    return [
+        motor.evaluate(datos, explain) for datos in chunk
+    ]
 
 
 # ════════════════════════════════════════════════════════════
@@ -455,6 +1005,7 @@ if __name__ == "__main__":
 
     # ── Test 4: Log creado ──
     print("\n── Test 4: Archivo de log ──")
+    engine.flush_log()
     log_path = _PROJECT_ROOT / "mihac_evaluations.log"
     assert log_path.exists(), "FAIL: log no creado"
     with open(log_path, "r", encoding="utf-8") as f:
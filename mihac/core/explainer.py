@@ -8,10 +8,98 @@
 # ============================================================
 
 import logging
-from datetime import datetime
+import operator
+import sys
+import time
+from collections import ChainMap
+from functools import lru_cache
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Clave de orden implementada en C para los sorts de reglas
+_itemgetter_0 = operator.itemgetter(0)
+
+# Claves de las entradas de regla, internadas explícitamente:
+# los lookups del bucle caliente resuelven por identidad contra
+# las mismas cadenas con que el scorer construye cada entrada,
+# sin comparar carácter a carácter. Quien arme entradas de regla
+# a mano debe usar literales (o sys.intern) como claves.
+_K_ID = sys.intern("id")
+_K_IMPACTO = sys.intern("impacto")
+_K_DESCRIPCION = sys.intern("descripcion")
+_K_TIPO = sys.intern("tipo")
+
+# Extracción en bloque de los campos del resultado que la
+# lógica Python consume: una llamada C en vez de un .get por
+# campo. El resto de los campos los resuelve la maquinaria de
+# formato directamente desde el ChainMap. El caso común
+# (resultado completo del motor) no paga defaults; el KeyError
+# cae al camino defensivo con .get.
+_RES_GETTER = operator.itemgetter(
+    "dti_clasificacion",
+    "sub_scores",
+    "reglas_activadas",
+)
+
+# Cola del ChainMap que alimenta a format_map: defaults para
+# los campos que el esqueleto lee directo de resultado/datos.
+_DEFAULTS: dict = {
+    "score_final": 0,
+    "dictamen": "N/A",
+    "umbral_aplicado": 80,
+    "dti_ratio": 0.0,
+    "dti_clasificacion": "N/A",
+    "ingreso_mensual": 0,
+    "total_deuda_actual": 0,
+}
+
+# Precondición barata de generate(): una diferencia de
+# frozenset contra las claves del resultado reemplaza al
+# try/except envolvente que nunca se tomaba en operación.
+_REQUIRED_KEYS = frozenset((
+    "score_final",
+    "dictamen",
+    "umbral_aplicado",
+    "dti_ratio",
+    "dti_clasificacion",
+    "sub_scores",
+    "reglas_activadas",
+))
+
+
+@lru_cache(maxsize=4096)
+def _linea_corta(
+    dictamen: str,
+    score: int,
+    dti: float,
+    dti_c: str,
+    hist_label: str,
+    proposito: str,
+) -> str:
+    """Formatea (y memoiza) la línea corta del resumen."""
+    return (
+        f"{dictamen} | Score: {score} | "
+        f"DTI: {dti:.1%} ({dti_c}) | "
+        f"Historial: {hist_label} | "
+        f"Propósito: {proposito}"
+    )
+
+# Fecha del reporte cacheada a resolución de segundo: en lotes
+# grandes strftime se paga ~una vez por segundo, no por reporte.
+_FECHA_CACHE: list = [0, ""]
+
+
+def _fecha_actual() -> str:
+    """Timestamp "YYYY-mm-dd HH:MM:SS" con caché de 1 s."""
+    ahora = int(time.time())
+    if ahora != _FECHA_CACHE[0]:
+        _FECHA_CACHE[0] = ahora
+        _FECHA_CACHE[1] = time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.localtime(ahora)
+        )
+    return _FECHA_CACHE[1]
+
 # ── Mapeo de etiquetas ──────────────────────────────────────
 
 _HISTORIAL_LABELS: dict[int, str] = {
@@ -20,7 +108,14 @@ _HISTORIAL_LABELS: dict[int, str] = {
     2: "Bueno",
 }
 
-_DTI_INTERPRETACION: dict[str, str] = {
+# Variante indexable: con claves enteras contiguas 0–2 el
+# acceso por índice de tupla evita hash + probe por línea.
+_HIST_LABELS_TUPLE = ("Malo", "Neutro", "Bueno")
+
+# Tablas de texto de solo lectura: la vista MappingProxyType
+# congela el contenido (nadie puede parchearlas en caliente)
+# sin copiar las cadenas.
+_DTI_INTERPRETACION: MappingProxyType = MappingProxyType({
     "BAJO": (
         "Carga de deuda saludable. El solicitante tiene "
         "amplio margen para nuevas obligaciones."
@@ -37,9 +132,144 @@ _DTI_INTERPRETACION: dict[str, str] = {
         "Sobreendeudamiento crítico. Más del 60% del "
         "ingreso se destina al servicio de deudas."
     ),
-}
-
-_SUGERENCIAS: dict[str, str] = {
+})
+
+# ── Esqueleto estático del reporte ──────────────────────────
+# Se arma una sola vez al importar; generate() lo materializa
+# con un único format_map en vez de ~30 appends por llamada.
+# Los bloques dinámicos (listas de reglas, conclusión) entran
+# como placeholders ya formateados.
+
+# Separador horizontal del reporte: se multiplica una sola vez
+# al importar, no en cada generate().
+_LINEA = "─" * 55
+
+_REPORT_TEMPLATE = "\n".join((
+    "{linea}",
+    "EVALUACIÓN CREDITICIA MIHAC",
+    "Fecha: {fecha}",
+    "{linea}",
+    "DICTAMEN: {dictamen}",
+    "Score crediticio: {score_final}/100  |  "
+    "Umbral requerido: {umbral_aplicado}",
+    "{linea}",
+    "",
+    "ANÁLISIS DE SOLVENCIA",
+    "• Ingreso mensual declarado: ${ingreso_mensual:,.2f}",
+    "• Deuda total vigente:       ${total_deuda_actual:,.2f}",
+    "• DTI (Relación Deuda/Ingreso): "
+    "{dti_ratio:.1%} — {dti_clasificacion}",
+    "  {interp}",
+    "",
+    "DESGLOSE DEL SCORE",
+    "  Solvencia    ({sol:>2}/40 pts): {barra_sol}",
+    "  Estabilidad  ({est:>2}/30 pts): {barra_est}",
+    "  Historial    ({his:>2}/20 pts): {barra_his}",
+    "  Perfil       ({per:>2}/10 pts): {barra_per}",
+    "",
+    "FACTORES DETERMINANTES",
+    "  Positivos:",
+    "{positivos_block}",
+    "  Negativos:",
+    "{negativos_block}",
+    "  Compensaciones heurísticas activadas:",
+    "{compensaciones_block}",
+    "",
+    "CONCLUSIÓN",
+    "  {conclusion}",
+    "{linea}",
+))
+
+# ── Líneas de factor prerrenderizadas ───────────────────────
+# En un lote el conjunto de reglas activables es fijo: cada
+# línea de factor depende solo de (id, impacto, descripción),
+# así que se renderiza una vez por regla y el resto de los
+# reportes la toman del caché; los bloques quedan en joins de
+# fragmentos ya formateados.
+
+
+@lru_cache(maxsize=1024)
+def _linea_positiva(
+    rid: str, impacto: int, desc: str
+) -> str:
+    return f"    ▲ {rid}: +{impacto} — {desc}"
+
+
+@lru_cache(maxsize=1024)
+def _linea_negativa(
+    rid: str, impacto: int, desc: str
+) -> str:
+    return f"    ▼ {rid}: {impacto} — {desc}"
+
+
+@lru_cache(maxsize=1024)
+def _linea_compensacion(
+    rid: str, impacto: int, desc: str
+) -> str:
+    signo = "+" if impacto > 0 else ""
+    return f"    ⟳ {rid}: {signo}{impacto} — {desc}"
+
+
+# ── Barras ASCII precomputadas ──────────────────────────────
+# Con longitud fija de 15 solo existen 16 barras posibles; se
+# materializan todas al importar y cada llamada es un índice de
+# tupla en vez de dos multiplicaciones de cadena + concatenación.
+
+_BAR_LEN = 15
+_BARS_15 = tuple(
+    "█" * i + "░" * (_BAR_LEN - i)
+    for i in range(_BAR_LEN + 1)
+)
+
+# ── Plantillas de conclusión ────────────────────────────────
+# Hoistadas a nivel de módulo: el texto fijo se construye una
+# sola vez y cada conclusión es un .format sobre la plantilla.
+
+_TMPL_APROBADO = (
+    "El perfil crediticio del solicitante "
+    "cumple con los criterios de aprobación "
+    "del sistema MIHAC. Los factores de "
+    "{factores} respaldan la capacidad y "
+    "voluntad de pago. Se recomienda proceder "
+    "con el desembolso por ${monto:,.2f} bajo "
+    "las condiciones estándar de la "
+    "institución."
+)
+
+_TMPL_RECHAZADO_CRITICO = (
+    "Solicitud RECHAZADA por "
+    "sobreendeudamiento crítico. El "
+    "solicitante destina el {dti:.1%} de su "
+    "ingreso mensual al servicio de deudas "
+    "existentes, lo que supera el límite de "
+    "riesgo aceptable (60%). Agregar nuevas "
+    "obligaciones comprometería seriamente "
+    "su capacidad de pago. Se recomienda "
+    "revisar en {meses} meses si la situación "
+    "de deuda mejora."
+)
+
+_TMPL_RECHAZADO = (
+    "El perfil crediticio no alcanza el "
+    "umbral mínimo requerido ({umbral} "
+    "puntos). Los factores de mayor impacto "
+    "negativo fueron: {factores}. Para "
+    "mejorar el resultado en una futura "
+    "evaluación, se sugiere: {sugerencias}."
+)
+
+_TMPL_REVISION = (
+    "El solicitante se encuentra en zona de "
+    "análisis. Su score de {score} puntos "
+    "está dentro del rango de revisión "
+    "({rango_min}–{umbral}), lo que indica "
+    "un perfil con características mixtas "
+    "que requieren evaluación adicional por "
+    "parte de un analista humano. "
+    "{factor_principal}"
+)
+
+_SUGERENCIAS: MappingProxyType = MappingProxyType({
     "R002": (
         "Establecer un historial crediticio positivo "
         "mediante pagos puntuales"
@@ -64,7 +294,58 @@ _SUGERENCIAS: dict[str, str] = {
         "Reducir las deudas vigentes antes de adquirir "
         "nuevas obligaciones financieras"
     ),
-}
+})
+
+# ── Textos de conclusión memoizados ─────────────────────────
+# Ambos helpers producen una de pocas decenas de cadenas a
+# partir de discriminantes discretos (IDs de regla, historial,
+# clasificación DTI); en lotes la misma combinación se repite
+# miles de veces, así que el join/las comparaciones se pagan
+# una vez por combinación y el resto son probes de dict.
+
+
+@lru_cache(maxsize=256)
+def _sugerencias_texto(rids: tuple) -> str:
+    """Une (y memoiza) las sugerencias para los IDs dados."""
+    sugs = [
+        s for s in map(_SUGERENCIAS.get, rids) if s
+    ]
+    if not sugs:
+        sugs = [
+            "mejorar el perfil financiero general "
+            "antes de una nueva solicitud"
+        ]
+    return "; ".join(sugs)
+
+
+@lru_cache(maxsize=16)
+def _factor_incertidumbre_texto(hist, dti_c: str) -> str:
+    """Texto del factor de incertidumbre por (hist, DTI)."""
+    if hist == 1:
+        return (
+            "El factor principal de incertidumbre es "
+            "el historial crediticio neutro, que no "
+            "permite confirmar un patrón de "
+            "cumplimiento."
+        )
+    if dti_c == "MODERADO":
+        return (
+            "El DTI moderado requiere verificación "
+            "adicional de la capacidad de pago real "
+            "del solicitante."
+        )
+    if dti_c == "ALTO":
+        return (
+            "El nivel de endeudamiento actual es "
+            "elevado y requiere evaluación detallada "
+            "de la capacidad de pago."
+        )
+
+    return (
+        "Se recomienda solicitar documentación "
+        "adicional para confirmar la capacidad "
+        "de pago."
+    )
 
 
 class Explainer:
@@ -80,6 +361,16 @@ class Explainer:
         resumen = exp.generate_short(datos, resultado)
     """
 
+    def __init__(self) -> None:
+        """Construye la tabla de despacho por dictamen."""
+        # Lookup O(1) dictamen → handler, en vez de la cadena
+        # de comparaciones de cadena por conclusión.
+        self._conclusion_handlers = {
+            "APROBADO": self._conc_aprobado,
+            "RECHAZADO": self._conc_rechazado,
+            "REVISION_MANUAL": self._conc_revision,
+        }
+
     # ────────────────────────────────────────────────────────
     # REPORTE COMPLETO
     # ────────────────────────────────────────────────────────
@@ -95,174 +386,125 @@ class Explainer:
                 reglas_activadas, dti_ratio, etc.
 
         Returns:
-            String multi-línea con la explicación completa.
+            String multi-línea con la explicación completa, o
+            un marcador de error si faltan campos obligatorios
+            en el resultado. Cualquier otro error propaga.
 
         Ejemplo::
 
             texto = explainer.generate(datos, resultado)
             print(texto)
         """
-        try:
-            linea = "─" * 55
-            fecha = datetime.now().strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-
-            score = resultado.get("score_final", 0)
-            dictamen = resultado.get("dictamen", "N/A")
-            umbral = resultado.get("umbral_aplicado", 80)
-            dti = resultado.get("dti_ratio", 0.0)
-            dti_clasif = resultado.get(
-                "dti_clasificacion", "N/A"
-            )
-            sub = resultado.get("sub_scores", {})
-            reglas = resultado.get("reglas_activadas", [])
-            ingreso = datos.get("ingreso_mensual", 0)
-            deuda = datos.get("total_deuda_actual", 0)
-            monto = datos.get("monto_credito", 0)
-
-            secciones = []
-
-            # ── Encabezado ──
-            secciones.append(linea)
-            secciones.append("EVALUACIÓN CREDITICIA MIHAC")
-            secciones.append(f"Fecha: {fecha}")
-            secciones.append(linea)
-            secciones.append(f"DICTAMEN: {dictamen}")
-            secciones.append(
-                f"Score crediticio: {score}/100  |  "
-                f"Umbral requerido: {umbral}"
-            )
-            secciones.append(linea)
-
-            # ── Análisis de solvencia ──
-            secciones.append("")
-            secciones.append("ANÁLISIS DE SOLVENCIA")
-            secciones.append(
-                f"• Ingreso mensual declarado: "
-                f"${ingreso:,.2f}"
-            )
-            secciones.append(
-                f"• Deuda total vigente:       "
-                f"${deuda:,.2f}"
-            )
-            interp = _DTI_INTERPRETACION.get(
-                dti_clasif, ""
-            )
-            secciones.append(
-                f"• DTI (Relación Deuda/Ingreso): "
-                f"{dti:.1%} — {dti_clasif}"
-            )
-            secciones.append(f"  {interp}")
-
-            # ── Desglose del score ──
-            secciones.append("")
-            secciones.append("DESGLOSE DEL SCORE")
-            sol = sub.get("solvencia", 0)
-            est = sub.get("estabilidad", 0)
-            his = sub.get("historial_score", 0)
-            per = sub.get("perfil", 0)
-
-            barra_sol = self._build_progress_bar(sol, 40)
-            barra_est = self._build_progress_bar(est, 30)
-            barra_his = self._build_progress_bar(his, 20)
-            barra_per = self._build_progress_bar(per, 10)
-
-            secciones.append(
-                f"  Solvencia    ({sol:>2}/40 pts): "
-                f"{barra_sol}"
-            )
-            secciones.append(
-                f"  Estabilidad  ({est:>2}/30 pts): "
-                f"{barra_est}"
-            )
-            secciones.append(
-                f"  Historial    ({his:>2}/20 pts): "
-                f"{barra_his}"
+        # Precondición en una llamada C; reemplaza al
+        # try/except que envolvía toda la función.
+        faltantes = _REQUIRED_KEYS - resultado.keys()
+        if faltantes:
+            logger.error(
+                "Resultado incompleto para el reporte: "
+                "faltan %s", sorted(faltantes)
             )
-            secciones.append(
-                f"  Perfil       ({per:>2}/10 pts): "
-                f"{barra_per}"
+            return (
+                "[Error al generar reporte: faltan campos "
+                f"{sorted(faltantes)}]"
             )
 
-            # ── Factores determinantes ──
-            secciones.append("")
-            secciones.append("FACTORES DETERMINANTES")
-
-            positivos = sorted(
-                [r for r in reglas if r["impacto"] > 0],
-                key=lambda x: x["impacto"],
-                reverse=True,
+        # El resultado viene completo: la extracción en bloque
+        # ya no necesita camino de fallback.
+        dti_clasif, sub, reglas = _RES_GETTER(resultado)
+
+        sol = sub.get("solvencia", 0)
+        est = sub.get("estabilidad", 0)
+        his = sub.get("historial_score", 0)
+        per = sub.get("perfil", 0)
+
+        # ── Bloques dinámicos ──
+        # Una sola pasada sobre las reglas: se acumulan
+        # (clave, regla) por signo y solo se ordenan las
+        # dos listas que lo necesitan, con clave en C.
+        con_pos: list[tuple] = []
+        con_neg: list[tuple] = []
+        compensaciones: list[dict] = []
+        for r in reglas:
+            imp = r[_K_IMPACTO]
+            if imp > 0:
+                con_pos.append((imp, r))
+            elif imp < 0:
+                con_neg.append((-imp, r))
+            if r[_K_TIPO] == "compensacion":
+                compensaciones.append(r)
+
+        con_pos.sort(key=_itemgetter_0, reverse=True)
+        con_neg.sort(key=_itemgetter_0, reverse=True)
+        positivos = [r for _, r in con_pos]
+        negativos = [r for _, r in con_neg]
+
+        positivos_block = "\n".join(
+            _linea_positiva(
+                r[_K_ID], r[_K_IMPACTO],
+                r[_K_DESCRIPCION],
             )
-            negativos = sorted(
-                [r for r in reglas if r["impacto"] < 0],
-                key=lambda x: abs(x["impacto"]),
-                reverse=True,
-            )
-            compensaciones = [
-                r for r in reglas
-                if r["tipo"] == "compensacion"
-            ]
-
-            secciones.append("  Positivos:")
-            if positivos:
-                for r in positivos:
-                    secciones.append(
-                        f"    ▲ {r['id']}: +{r['impacto']} — "
-                        f"{r['descripcion']}"
-                    )
-            else:
-                secciones.append(
-                    "    No se identificaron factores "
-                    "positivos relevantes."
-                )
-
-            secciones.append("  Negativos:")
-            if negativos:
-                for r in negativos:
-                    secciones.append(
-                        f"    ▼ {r['id']}: {r['impacto']} — "
-                        f"{r['descripcion']}"
-                    )
-            else:
-                secciones.append(
-                    "    No se identificaron factores "
-                    "negativos."
-                )
+            for r in positivos
+        ) if positivos else (
+            "    No se identificaron factores "
+            "positivos relevantes."
+        )
 
-            secciones.append(
-                "  Compensaciones heurísticas activadas:"
+        negativos_block = "\n".join(
+            _linea_negativa(
+                r[_K_ID], r[_K_IMPACTO],
+                r[_K_DESCRIPCION],
             )
-            if compensaciones:
-                for r in compensaciones:
-                    signo = "+" if r["impacto"] > 0 else ""
-                    secciones.append(
-                        f"    ⟳ {r['id']}: {signo}"
-                        f"{r['impacto']} — {r['descripcion']}"
-                    )
-            else:
-                secciones.append(
-                    "    No se activaron compensaciones."
-                )
+            for r in negativos
+        ) if negativos else (
+            "    No se identificaron factores "
+            "negativos."
+        )
 
-            # ── Conclusión ──
-            secciones.append("")
-            secciones.append("CONCLUSIÓN")
-            conclusion = self._generar_conclusion(
-                datos, resultado, positivos, negativos
+        compensaciones_block = "\n".join(
+            _linea_compensacion(
+                r[_K_ID], r[_K_IMPACTO],
+                r[_K_DESCRIPCION],
             )
-            secciones.append(f"  {conclusion}")
-            secciones.append(linea)
-
-            return "\n".join(secciones)
+            for r in compensaciones
+        ) if compensaciones else (
+            "    No se activaron compensaciones."
+        )
 
-        except Exception as e:
-            logger.error(
-                "Error generando explicación: %s", e
-            )
-            return (
-                f"[Error al generar reporte: {e}]"
-            )
+        # ── Un solo pase de formato sobre el esqueleto ──
+        # ChainMap: los campos crudos del esqueleto se
+        # resuelven bajo demanda desde resultado/datos (con
+        # _DEFAULTS al final) y el primer dict solo lleva
+        # los valores derivados.
+        return _REPORT_TEMPLATE.format_map(ChainMap({
+            "linea": _LINEA,
+            "fecha": _fecha_actual(),
+            "interp": _DTI_INTERPRETACION.get(
+                dti_clasif, ""
+            ),
+            "sol": sol,
+            "est": est,
+            "his": his,
+            "per": per,
+            "barra_sol": self._build_progress_bar(
+                sol, 40
+            ),
+            "barra_est": self._build_progress_bar(
+                est, 30
+            ),
+            "barra_his": self._build_progress_bar(
+                his, 20
+            ),
+            "barra_per": self._build_progress_bar(
+                per, 10
+            ),
+            "positivos_block": positivos_block,
+            "negativos_block": negativos_block,
+            "compensaciones_block":
+                compensaciones_block,
+            "conclusion": self._generar_conclusion(
+                datos, resultado, positivos, negativos
+            ),
+        }, resultado, datos, _DEFAULTS))
 
     # ────────────────────────────────────────────────────────
     # REPORTE CORTO (una línea)
@@ -292,18 +534,22 @@ class Explainer:
         dti_c = resultado.get("dti_clasificacion", "N/A")
 
         hist_val = datos.get("historial_crediticio", -1)
-        hist_label = _HISTORIAL_LABELS.get(
-            hist_val, "Desconocido"
+        # El 'in' sobre tupla corta es más barato que el hash
+        # del dict y tolera valores fuera de rango o no enteros
+        hist_label = (
+            _HIST_LABELS_TUPLE[int(hist_val)]
+            if hist_val in (0, 1, 2)
+            else "Desconocido"
         )
         proposito = datos.get(
             "proposito_credito", "N/A"
         )
 
-        return (
-            f"{dictamen} | Score: {score} | "
-            f"DTI: {dti:.1%} ({dti_c}) | "
-            f"Historial: {hist_label} | "
-            f"Propósito: {proposito}"
+        # El formateo se memoiza por combinación de valores:
+        # el mismo perfil relogueado no repaga los f-strings.
+        return _linea_corta(
+            dictamen, score, dti, dti_c,
+            hist_label, proposito,
         )
 
     # ────────────────────────────────────────────────────────
@@ -331,12 +577,31 @@ class Explainer:
             barra = self._build_progress_bar(12, 20, 15)
             # "█████████░░░░░░"
         """
+        # División entera (sin pasar por float ni int()) y
+        # clamp con if/else inline: se evitan tres llamadas a
+        # builtins por barra.
+        if longitud == _BAR_LEN:
+            # Vía rápida: índice directo en la tabla
+            if maximo <= 0:
+                return _BARS_15[0]
+            filled = _BAR_LEN * valor // maximo
+            filled = (
+                0 if filled < 0
+                else _BAR_LEN if filled > _BAR_LEN
+                else filled
+            )
+            return _BARS_15[filled]
+
+        # Longitudes no estándar: construcción directa
         if maximo <= 0:
             return "░" * longitud
-        filled = int(longitud * valor / maximo)
-        filled = max(0, min(filled, longitud))
-        empty = longitud - filled
-        return "█" * filled + "░" * empty
+        filled = longitud * valor // maximo
+        filled = (
+            0 if filled < 0
+            else longitud if filled > longitud
+            else filled
+        )
+        return "█" * filled + "░" * (longitud - filled)
 
     # ────────────────────────────────────────────────────────
     # CONCLUSIÓN CONTEXTUAL
@@ -360,72 +625,67 @@ class Explainer:
         Returns:
             Texto de conclusión profesional.
         """
-        dictamen = resultado.get("dictamen", "")
-        score = resultado.get("score_final", 0)
-        umbral = resultado.get("umbral_aplicado", 80)
-        dti = resultado.get("dti_ratio", 0.0)
-        dti_c = resultado.get("dti_clasificacion", "")
-        monto = datos.get("monto_credito", 0)
+        handler = self._conclusion_handlers.get(
+            resultado.get("dictamen", "")
+        )
+        if handler is None:
+            return "Dictamen no reconocido."
+        return handler(
+            datos, resultado, positivos, negativos
+        )
 
-        if dictamen == "APROBADO":
-            factores = self._top_n_factores(positivos, 2)
-            return (
-                f"El perfil crediticio del solicitante "
-                f"cumple con los criterios de aprobación "
-                f"del sistema MIHAC. Los factores de "
-                f"{factores} respaldan la capacidad y "
-                f"voluntad de pago. Se recomienda proceder "
-                f"con el desembolso por ${monto:,.2f} bajo "
-                f"las condiciones estándar de la "
-                f"institución."
-            )
+    def _conc_aprobado(
+        self,
+        datos: dict,
+        resultado: dict,
+        positivos: list[dict],
+        negativos: list[dict],
+    ) -> str:
+        """Conclusión para dictamen APROBADO."""
+        return _TMPL_APROBADO.format(
+            factores=self._top_n_factores(positivos, 2),
+            monto=datos.get("monto_credito", 0),
+        )
 
-        if dictamen == "RECHAZADO" and dti_c == "CRITICO":
-            meses = 12 if dti > 0.80 else 6
-            return (
-                f"Solicitud RECHAZADA por "
-                f"sobreendeudamiento crítico. El "
-                f"solicitante destina el {dti:.1%} de su "
-                f"ingreso mensual al servicio de deudas "
-                f"existentes, lo que supera el límite de "
-                f"riesgo aceptable (60%). Agregar nuevas "
-                f"obligaciones comprometería seriamente "
-                f"su capacidad de pago. Se recomienda "
-                f"revisar en {meses} meses si la situación "
-                f"de deuda mejora."
+    def _conc_rechazado(
+        self,
+        datos: dict,
+        resultado: dict,
+        positivos: list[dict],
+        negativos: list[dict],
+    ) -> str:
+        """Conclusión para dictamen RECHAZADO."""
+        dti = resultado.get("dti_ratio", 0.0)
+        if resultado.get("dti_clasificacion", "") == "CRITICO":
+            return _TMPL_RECHAZADO_CRITICO.format(
+                dti=dti,
+                meses=12 if dti > 0.80 else 6,
             )
-
-        if dictamen == "RECHAZADO":
-            factores = self._top_n_factores(negativos, 2)
-            sugerencias = self._obtener_sugerencias(
+        return _TMPL_RECHAZADO.format(
+            umbral=resultado.get("umbral_aplicado", 80),
+            factores=self._top_n_factores(negativos, 2),
+            sugerencias=self._obtener_sugerencias(
                 negativos, 2
-            )
-            return (
-                f"El perfil crediticio no alcanza el "
-                f"umbral mínimo requerido ({umbral} "
-                f"puntos). Los factores de mayor impacto "
-                f"negativo fueron: {factores}. Para "
-                f"mejorar el resultado en una futura "
-                f"evaluación, se sugiere: {sugerencias}."
-            )
+            ),
+        )
 
-        if dictamen == "REVISION_MANUAL":
-            factor_principal = self._factor_incertidumbre(
+    def _conc_revision(
+        self,
+        datos: dict,
+        resultado: dict,
+        positivos: list[dict],
+        negativos: list[dict],
+    ) -> str:
+        """Conclusión para dictamen REVISION_MANUAL."""
+        umbral = resultado.get("umbral_aplicado", 80)
+        return _TMPL_REVISION.format(
+            score=resultado.get("score_final", 0),
+            rango_min=umbral - 20,
+            umbral=umbral,
+            factor_principal=self._factor_incertidumbre(
                 datos, resultado
-            )
-            rango_min = umbral - 20
-            return (
-                f"El solicitante se encuentra en zona de "
-                f"análisis. Su score de {score} puntos "
-                f"está dentro del rango de revisión "
-                f"({rango_min}–{umbral}), lo que indica "
-                f"un perfil con características mixtas "
-                f"que requieren evaluación adicional por "
-                f"parte de un analista humano. "
-                f"{factor_principal}"
-            )
-
-        return "Dictamen no reconocido."
+            ),
+        )
 
     def _top_n_factores(
         self, reglas: list[dict], n: int
@@ -433,63 +693,32 @@ class Explainer:
         """Devuelve nombres de los top-N factores."""
         if not reglas:
             return "perfil general"
-        top = reglas[:n]
-        nombres = [r["descripcion"].lower() for r in top]
+        nombres = [
+            r[_K_DESCRIPCION].lower() for r in reglas[:n]
+        ]
         if len(nombres) == 1:
             return nombres[0]
-        return " y ".join(
-            [", ".join(nombres[:-1]), nombres[-1]]
-        ) if len(nombres) > 2 else " y ".join(nombres)
+        # Un solo join + concat, sin la lista intermedia
+        # [unidos, último] de la versión anterior.
+        return (
+            ", ".join(nombres[:-1]) + " y " + nombres[-1]
+        )
 
     def _obtener_sugerencias(
         self, negativos: list[dict], n: int
     ) -> str:
         """Genera sugerencias basadas en factores negativos."""
-        sugs: list[str] = []
-        for r in negativos[:n]:
-            rid = r.get("id", "")
-            sug = _SUGERENCIAS.get(rid)
-            if sug:
-                sugs.append(sug)
-
-        if not sugs:
-            sugs.append(
-                "mejorar el perfil financiero general "
-                "antes de una nueva solicitud"
-            )
-        return "; ".join(sugs)
+        return _sugerencias_texto(tuple(
+            r.get("id", "") for r in negativos[:n]
+        ))
 
     def _factor_incertidumbre(
         self, datos: dict, resultado: dict
     ) -> str:
         """Identifica el factor de incertidumbre principal."""
-        hist = datos.get("historial_crediticio", -1)
-        dti_c = resultado.get("dti_clasificacion", "")
-
-        if hist == 1:
-            return (
-                "El factor principal de incertidumbre es "
-                "el historial crediticio neutro, que no "
-                "permite confirmar un patrón de "
-                "cumplimiento."
-            )
-        if dti_c == "MODERADO":
-            return (
-                "El DTI moderado requiere verificación "
-                "adicional de la capacidad de pago real "
-                "del solicitante."
-            )
-        if dti_c == "ALTO":
-            return (
-                "El nivel de endeudamiento actual es "
-                "elevado y requiere evaluación detallada "
-                "de la capacidad de pago."
-            )
-
-        return (
-            "Se recomienda solicitar documentación "
-            "adicional para confirmar la capacidad "
-            "de pago."
+        return _factor_incertidumbre_texto(
+            datos.get("historial_crediticio", -1),
+            resultado.get("dti_clasificacion", ""),
         )
 
 
@@ -6,16 +6,77 @@
 # reglas heurísticas leídas dinámicamente de rules.json.
 # ============================================================
 
-import json
 import logging
+import operator
+import sys
+from bisect import bisect
+from collections import ChainMap
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import orjson
+
 logger = logging.getLogger(__name__)
 
 _CORE_DIR = Path(__file__).resolve().parent
 _PROJECT_ROOT = _CORE_DIR.parent
-_RULES_PATH = _PROJECT_ROOT / "knowledge" / "rules.json"
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from config import (  # noqa: E402
+    CONFIG,
+    DICTAMEN_APROBADO,
+    DICTAMEN_RECHAZADO,
+    DICTAMEN_REVISION,
+)
+from core.config_io import load_json  # noqa: E402
+
+
+# Globals restringidos para los predicados compilados: las
+# expresiones solo pueden leer los campos del solicitante.
+_EVAL_GLOBALS: dict = {"__builtins__": {}}
+
+# Operadores que se traducen a expresión Python compilable
+_OPS_EXPR = frozenset(("==", "!=", ">", ">=", "<", "<="))
+
+# Reglas compiladas compartidas entre instancias, por
+# (ruta, mtime_ns): el parse del JSON ya lo cachea config_io,
+# esto evita además recompilar los predicados en cada
+# ScoringEngine() (cargas en frío de workers, suites de tests).
+# La lista es de solo lectura tras construirse y las entradas
+# se copian al activarse, así que compartirla es seguro.
+_COMPILADAS_CACHE: dict[tuple, list[tuple]] = {}
+
+# Clasificación del DTI como búsqueda binaria + LUT: bisect
+# sobre los cortes da el índice de banda en una llamada C y las
+# tuplas paralelas lo traducen a etiqueta o a ajuste de
+# solvencia. Así calculate_dti y _score_solvencia comparten la
+# misma cascada sin duplicarla en ifs.
+_DTI_LABELS = ("BAJO", "MODERADO", "ALTO", "CRITICO")
+_DTI_CUTS_SOLV = (0.25, 0.40, 0.60)
+_DTI_SOLV_ADJ = (10.0, 5.0, -5.0, -15.0)
+
+# LUT propósito → puntos del sub-score de perfil; antes se
+# reconstruía el dict en cada _score_perfil.
+_PROPOSITO_PTS = {
+    "Negocio": 10,
+    "Educacion": 8,
+    "Emergencia": 6,
+    "Consumo": 4,
+    "Vacaciones": 0,
+}
+
+# Los mismos operadores como funciones en C: aplicados a un
+# array NumPy evalúan la condición para el lote completo.
+_OPS_VEC = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
 
 
 class ScoringEngine:
@@ -47,19 +108,55 @@ class ScoringEngine:
             rules_path: Ruta al archivo rules.json.
                 Si es None, usa la ruta por defecto.
         """
-        ruta = Path(rules_path) if rules_path else _RULES_PATH
+        # Snapshot congelado de umbrales (frozen + slots):
+        # lecturas de atributo baratas en el camino caliente
+        self._cfg = CONFIG
+        # Cortes del snapshot como tupla para bisect
+        self._dti_cuts = (
+            self._cfg.dti_bajo,
+            self._cfg.dti_moderado,
+            self._cfg.dti_alto,
+        )
+        ruta = (
+            Path(rules_path) if rules_path
+            else self._cfg.rules_file
+        )
         self._reglas: list[dict] = []
         self._cargar_reglas(ruta)
 
+        # Predicados precompilados a bytecode: el walk del JSON
+        # por condición se paga una vez por (ruta, mtime), no
+        # por instancia ni por fila.
+        try:
+            clave = (str(ruta), ruta.stat().st_mtime_ns)
+        except OSError:
+            clave = None
+        compiladas = (
+            _COMPILADAS_CACHE.get(clave)
+            if clave is not None else None
+        )
+        if compiladas is None:
+            self._reglas_compiladas: list[tuple] = []
+            self._compilar_reglas()
+            if clave is not None:
+                _COMPILADAS_CACHE[clave] = (
+                    self._reglas_compiladas
+                )
+        else:
+            self._reglas_compiladas = compiladas
+
     def _cargar_reglas(self, ruta: Path) -> None:
         """Lee y parsea el archivo de reglas JSON.
 
+        Delegado en config_io.load_json: parse con orjson y
+        caché por mtime, así N instancias del motor comparten
+        un solo parse del mismo archivo.
+
         Args:
             ruta: Ruta absoluta al archivo rules.json.
         """
         try:
-            with open(ruta, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json(ruta)
             self._reglas = data.get("reglas", [])
             logger.info(
                 "Cargadas %d reglas desde %s",
@@ -68,10 +165,147 @@ class ScoringEngine:
         except FileNotFoundError:
             logger.error("Archivo de reglas no encontrado: %s", ruta)
             self._reglas = []
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error("Error al parsear rules.json: %s", e)
             self._reglas = []
 
+    # ────────────────────────────────────────────────────────
+    # COMPILACIÓN DE REGLAS
+    # ────────────────────────────────────────────────────────
+
+    def _compilar_reglas(self) -> None:
+        """Precompila las reglas activas a bytecode de Python.
+
+        Por cada regla activa guarda una tupla
+        (regla, destino, código, entrada): el predicado como
+        objeto código listo para eval(), el bucket al que va si
+        se activa y la entrada de salida ya construida. Las
+        reglas que no se pueden traducir (operador u campo no
+        estándar) quedan con código None y caen a la evaluación
+        interpretada.
+        """
+        for regla in self._reglas:
+            if not regla.get("activa", False):
+                continue
+
+            tipo = regla.get("tipo", "directa")
+            try:
+                entrada = {
+                    "id": regla["id"],
+                    "impacto": regla["impacto_puntos"],
+                    "descripcion": regla["descripcion"],
+                    "tipo": tipo,
+                }
+            except KeyError as e:
+                logger.warning(
+                    "Regla %s sin campo obligatorio %s; "
+                    "se omite",
+                    regla.get("id", "?"), e
+                )
+                continue
+            if "flag" in regla:
+                entrada["flag"] = regla["flag"]
+
+            destino = (
+                "compensaciones"
+                if tipo == "compensacion"
+                else "directas"
+            )
+            codigo = self._compile_rule(regla, tipo)
+            self._reglas_compiladas.append(
+                (regla, destino, codigo, entrada)
+            )
+
+    def _compile_rule(self, regla: dict, tipo: str):
+        """Traduce una regla JSON a un objeto código.
+
+        Una regla directa se vuelve ``campo op valor`` y una de
+        compensación la conjunción ``and`` de sus condiciones;
+        la comparación cruzada usa ``campo op (ref * factor)``.
+        Un campo ausente en los datos produce NameError al
+        evaluar, que el caller trata como no-cumplida (mismo
+        comportamiento que el intérprete con valor None).
+
+        Args:
+            regla: Regla cruda del JSON.
+            tipo: "directa" o "compensacion".
+
+        Returns:
+            Objeto código para eval(), o None si la regla no es
+            traducible y debe evaluarse interpretada.
+        """
+        try:
+            if tipo == "directa":
+                valor = regla.get("condicion_valor")
+                if valor is None:
+                    return None
+                expr = self._expr_condicion(
+                    regla.get("condicion_campo", ""),
+                    regla.get("condicion_operador", "=="),
+                    repr(valor),
+                )
+                if expr is None:
+                    return None
+            elif tipo == "compensacion":
+                condiciones = regla.get("condiciones", [])
+                if not condiciones:
+                    return None
+                partes = []
+                for cond in condiciones:
+                    if "campo_referencia" in cond:
+                        ref = cond["campo_referencia"]
+                        factor = cond.get("factor", 1.0)
+                        if (not isinstance(
+                                factor, (int, float))
+                                or not str(ref)
+                                .isidentifier()):
+                            return None
+                        valor_expr = f"({ref} * {factor!r})"
+                    else:
+                        valor = cond.get("valor")
+                        if valor is None:
+                            return None
+                        valor_expr = repr(valor)
+                    parte = self._expr_condicion(
+                        cond.get("campo", ""),
+                        cond.get("operador", "=="),
+                        valor_expr,
+                    )
+                    if parte is None:
+                        return None
+                    partes.append(parte)
+                expr = " and ".join(partes)
+            else:
+                return None
+
+            return compile(expr, "<regla>", "eval")
+        except Exception as e:
+            logger.warning(
+                "No se pudo compilar la regla %s: %s",
+                regla.get("id", "?"), e
+            )
+            return None
+
+    @staticmethod
+    def _expr_condicion(
+        campo: str, operador: str, valor_expr: str
+    ) -> str | None:
+        """Arma la expresión de una condición, o None.
+
+        El guard ``is not None`` replica el short-circuit del
+        intérprete (un campo presente pero None cuenta como
+        no-cumplida): sin él, ``None != valor`` evaluaría True
+        y la versión compilada activaría reglas que la
+        interpretada no activa.
+        """
+        if (operador not in _OPS_EXPR
+                or not str(campo).isidentifier()):
+            return None
+        return (
+            f"({campo} is not None "
+            f"and {campo} {operador} {valor_expr})"
+        )
+
     # ────────────────────────────────────────────────────────
     # DTI (Debt-To-Income)
     # ────────────────────────────────────────────────────────
@@ -98,17 +332,49 @@ class ScoringEngine:
             return (1.0, "CRITICO")
 
         dti = round(deuda / ingreso, 4)
+        # bisect (cota superior estricta) reproduce la cascada
+        # dti < corte en una sola llamada C
+        return (dti, _DTI_LABELS[bisect(self._dti_cuts, dti)])
 
-        if dti < 0.25:
-            clasificacion = "BAJO"
-        elif dti < 0.40:
-            clasificacion = "MODERADO"
-        elif dti < 0.60:
-            clasificacion = "ALTO"
-        else:
-            clasificacion = "CRITICO"
+    def calculate_dti_vec(
+        self,
+        ingresos: "np.ndarray",
+        deudas: "np.ndarray",
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """Versión vectorizada de calculate_dti para lotes.
+
+        Opera elemento a elemento sobre arrays NumPy: misma
+        semántica que calculate_dti (ingreso <= 0 → DTI 1.0
+        CRITICO, redondeo a 4 decimales, umbrales 25/40/60%).
 
-        return (dti, clasificacion)
+        Args:
+            ingresos: Array float64 de ingresos mensuales.
+            deudas: Array float64 de deudas totales.
+
+        Returns:
+            Tupla (array de DTI, array de clasificaciones).
+        """
+        ingresos = np.asarray(ingresos, dtype=np.float64)
+        deudas = np.asarray(deudas, dtype=np.float64)
+
+        con_ingreso = ingresos > 0
+        dti = np.full_like(ingresos, 1.0)
+        np.divide(deudas, ingresos, out=dti, where=con_ingreso)
+        dti = np.round(dti, 4)
+        dti[~con_ingreso] = 1.0
+
+        cfg = self._cfg
+        clasif = np.select(
+            [
+                ~con_ingreso,
+                dti < cfg.dti_bajo,
+                dti < cfg.dti_moderado,
+                dti < cfg.dti_alto,
+            ],
+            ["CRITICO", "BAJO", "MODERADO", "ALTO"],
+            default="CRITICO",
+        )
+        return (dti, clasif)
 
     # ────────────────────────────────────────────────────────
     # SUB-SCORES
@@ -140,6 +406,106 @@ class ScoringEngine:
             "perfil": self._score_perfil(datos),
         }
 
+    def calculate_subscores_vec(
+        self,
+        columnas: dict[str, "np.ndarray"],
+        dti: "np.ndarray",
+    ) -> dict[str, "np.ndarray"]:
+        """Versión vectorizada de calculate_subscores (SoA).
+
+        Opera columna a columna sobre el lote completo: cada
+        sub-score se resuelve con np.select/np.clip sobre los
+        N solicitantes a la vez, sin un frame de Python por
+        fila. Misma semántica que la versión escalar, incluido
+        el truncado a entero y los clampeos por sub-score.
+
+        Args:
+            columnas: Dict campo → array del lote (un pandas
+                DataFrame también funciona: solo se usa .get
+                por columna). Los campos numéricos como
+                float/int y los categóricos (tipo_vivienda,
+                proposito_credito) como arrays de cadenas. Los
+                campos ausentes usan el mismo default que la
+                versión escalar.
+            dti: Array float64 de ratios DTI ya calculados.
+
+        Returns:
+            Dict con arrays int64: solvencia, estabilidad,
+            historial_score y perfil.
+        """
+        dti = np.asarray(dti, dtype=np.float64)
+        n = dti.shape[0]
+
+        def col(nombre: str, default) -> "np.ndarray":
+            valores = columnas.get(nombre)
+            if valores is None:
+                return np.full(n, default)
+            return np.asarray(valores)
+
+        # Solvencia (max 40)
+        ingreso = col("ingreso_mensual", 0.0)
+        deps = col("numero_dependientes", 0.0)
+        base = np.minimum(ingreso / 30000.0 * 20.0, 20.0)
+        ajuste_dti = np.select(
+            [dti < 0.25, dti < 0.40, dti < 0.60],
+            [10.0, 5.0, -5.0],
+            default=-15.0,
+        )
+        solvencia = np.clip(
+            base + ajuste_dti - deps * 1.5, 0, 40
+        ).astype(np.int64)
+
+        # Estabilidad (max 30)
+        antig = col("antiguedad_laboral", 0.0)
+        vivienda = col("tipo_vivienda", "")
+        pts_antig = np.select(
+            [antig < 1, antig < 2, antig < 5],
+            [0, 8, 18],
+            default=28,
+        )
+        pts_viv = np.select(
+            [vivienda == "Propia", vivienda == "Familiar"],
+            [8, 3],
+            default=0,
+        )
+        estabilidad = np.minimum(
+            pts_antig + pts_viv, 30
+        ).astype(np.int64)
+
+        # Historial (max 20)
+        hist = col("historial_crediticio", 0)
+        historial = np.select(
+            [hist == 2, hist == 1], [20, 10], default=0
+        ).astype(np.int64)
+
+        # Perfil (max 10)
+        prop = col("proposito_credito", "")
+        edad = col("edad", 0.0)
+        pts_prop = np.select(
+            [
+                prop == "Negocio",
+                prop == "Educacion",
+                prop == "Emergencia",
+                prop == "Consumo",
+                prop == "Vacaciones",
+            ],
+            [10, 8, 6, 4, 0],
+            default=2,
+        )
+        bonus_edad = np.where(
+            (edad >= 25) & (edad <= 55), 2, 0
+        )
+        perfil = np.minimum(
+            pts_prop + bonus_edad, 10
+        ).astype(np.int64)
+
+        return {
+            "solvencia": solvencia,
+            "estabilidad": estabilidad,
+            "historial_score": historial,
+            "perfil": perfil,
+        }
+
     def _score_solvencia(
         self, datos: dict, dti: float
     ) -> int:
@@ -155,15 +521,11 @@ class ScoringEngine:
         # Base: ingreso en escala 0–20
         base = min(ingreso / 30000.0 * 20.0, 20.0)
 
-        # Ajuste por DTI
-        if dti < 0.25:
-            ajuste_dti = 10.0
-        elif dti < 0.40:
-            ajuste_dti = 5.0
-        elif dti < 0.60:
-            ajuste_dti = -5.0
-        else:
-            ajuste_dti = -15.0
+        # Ajuste por DTI: misma banda que la clasificación,
+        # resuelta por bisect + LUT
+        ajuste_dti = _DTI_SOLV_ADJ[
+            bisect(_DTI_CUTS_SOLV, dti)
+        ]
 
         # Penalización por dependientes
         ajuste_deps = deps * 1.5
@@ -219,14 +581,7 @@ class ScoringEngine:
         prop = datos.get("proposito_credito", "")
         edad = datos.get("edad", 0)
 
-        proposito_pts = {
-            "Negocio": 10,
-            "Educacion": 8,
-            "Emergencia": 6,
-            "Consumo": 4,
-            "Vacaciones": 0,
-        }
-        pts = proposito_pts.get(prop, 2)
+        pts = _PROPOSITO_PTS.get(prop, 2)
 
         # Bonus por edad óptima (25–55)
         if 25 <= edad <= 55:
@@ -260,45 +615,266 @@ class ScoringEngine:
             for r in reglas:
                 print(r["id"], r["impacto"])
         """
-        # Datos extendidos con campo virtual 'dti'
-        datos_ext = {**datos, "dti": dti}
-        activadas: list[dict] = []
+        grupos = self.apply_rules_bucketed(datos, dti)
+        return grupos["directas"] + grupos["compensaciones"]
 
-        for regla in self._reglas:
-            if not regla.get("activa", False):
-                continue
+    def apply_rules_bucketed(
+        self, datos: dict, dti: float
+    ) -> dict[str, list[dict]]:
+        """Evalúa las reglas y las separa por tipo en una pasada.
 
-            tipo = regla.get("tipo", "directa")
-            cumple = False
+        Devuelve los grupos ya construidos para que el motor no
+        tenga que recorrer la lista una segunda vez filtrando
+        por tipo, y el impacto total acumulado en el mismo bucle
+        de activación para que calculate_final_score no vuelva a
+        recorrer las listas sumando.
 
-            try:
-                if tipo == "directa":
-                    cumple = self._evaluar_directa(
-                        datos_ext, regla
-                    )
-                elif tipo == "compensacion":
-                    cumple = self._evaluar_compensacion(
-                        datos_ext, regla
+        Args:
+            datos: Diccionario validado del solicitante.
+            dti: Ratio DTI calculado.
+
+        Returns:
+            Dict con las listas 'directas' y 'compensaciones'
+            más 'impacto_total' (int) ya sumado.
+        """
+        # Datos extendidos con campo virtual 'dti': ChainMap en
+        # vez de copiar los F campos del solicitante; eval()
+        # acepta cualquier mapping como locals y los .get de los
+        # evaluadores interpretados también lo atraviesan.
+        datos_ext = ChainMap({"dti": dti}, datos)
+        directas: list[dict] = []
+        compensaciones: list[dict] = []
+        grupos: dict = {
+            "directas": directas,
+            "compensaciones": compensaciones,
+        }
+        impacto_total = 0
+
+        for (regla, destino, codigo,
+                entrada) in self._reglas_compiladas:
+            if codigo is not None:
+                # Predicado compilado: NameError = campo
+                # ausente, TypeError = tipos incomparables;
+                # ambos cuentan como no-cumplida, igual que
+                # en el intérprete.
+                try:
+                    cumple = bool(eval(
+                        codigo, _EVAL_GLOBALS, datos_ext
+                    ))
+                except (NameError, TypeError):
+                    cumple = False
+            else:
+                cumple = False
+                tipo = entrada["tipo"]
+                try:
+                    if tipo == "directa":
+                        cumple = self._evaluar_directa(
+                            datos_ext, regla
+                        )
+                    elif tipo == "compensacion":
+                        cumple = self._evaluar_compensacion(
+                            datos_ext, regla
+                        )
+                except Exception as e:
+                    logger.warning(
+                        "Error evaluando regla %s: %s",
+                        regla.get("id", "?"), e
                     )
+                    continue
+
+            if cumple:
+                # Copia superficial: la entrada precompilada no
+                # debe compartirse entre resultados. El impacto
+                # se acumula aquí mismo, sin segunda pasada.
+                grupos[destino].append(dict(entrada))
+                impacto_total += entrada["impacto"]
+
+        grupos["impacto_total"] = impacto_total
+        return grupos
+
+    def apply_rules_batch(
+        self,
+        columnas: dict[str, "np.ndarray"],
+        dtis: "np.ndarray",
+    ) -> list[dict[str, list[dict]]]:
+        """Evalúa las reglas activas sobre un lote SoA completo.
+
+        Por cada regla construye una máscara booleana de los N
+        solicitantes con comparaciones NumPy (una expresión en C
+        por condición) en vez de evaluar el predicado fila a
+        fila. Las reglas que no admiten la forma vectorizada
+        (tipos incomparables, condiciones no estándar) caen a la
+        evaluación interpretada solo para esa regla.
+
+        Args:
+            columnas: Dict campo → array del lote (un pandas
+                DataFrame también funciona). Los categóricos
+                como arrays de cadenas.
+            dtis: Array float64 de ratios DTI, alineado por
+                posición; cubre el campo virtual 'dti'.
+
+        Returns:
+            Lista de N dicts con las listas 'directas' y
+            'compensaciones' más 'impacto_total' de cada
+            solicitante, igual que apply_rules_bucketed fila a
+            fila.
+        """
+        dtis = np.asarray(dtis, dtype=np.float64)
+        n = dtis.shape[0]
+        resultados: list[dict[str, list[dict]]] = [
+            {"directas": [], "compensaciones": [], "impacto_total": 0}
+            for _ in range(n)
+        ]
+        filas: list[dict] | None = None
+
+        for (regla, destino, _codigo,
+                entrada) in self._reglas_compiladas:
+            tipo = entrada["tipo"]
+            try:
+                mask = self._mask_regla(
+                    regla, tipo, columnas, dtis, n
+                )
             except Exception as e:
                 logger.warning(
-                    "Error evaluando regla %s: %s",
+                    "Regla %s no vectorizable: %s",
                     regla.get("id", "?"), e
                 )
-                continue
+                mask = None
+
+            if mask is None:
+                # Fallback fila a fila; las filas dict se
+                # materializan una sola vez para todo el lote.
+                if filas is None:
+                    filas = self._filas_de_columnas(
+                        columnas, dtis, n
+                    )
+                evalua = (
+                    self._evaluar_directa
+                    if tipo == "directa"
+                    else self._evaluar_compensacion
+                )
+                mask = np.fromiter(
+                    (evalua(f, regla) for f in filas),
+                    dtype=bool,
+                    count=n,
+                )
 
-            if cumple:
-                entrada = {
-                    "id": regla["id"],
-                    "impacto": regla["impacto_puntos"],
-                    "descripcion": regla["descripcion"],
-                    "tipo": tipo,
-                }
-                if "flag" in regla:
-                    entrada["flag"] = regla["flag"]
-                activadas.append(entrada)
+            impacto = entrada["impacto"]
+            for i in np.nonzero(mask)[0]:
+                fila_res = resultados[i]
+                fila_res[destino].append(dict(entrada))
+                fila_res["impacto_total"] += impacto
+
+        return resultados
+
+    def _mask_regla(
+        self,
+        regla: dict,
+        tipo: str,
+        columnas,
+        dtis: "np.ndarray",
+        n: int,
+    ) -> "np.ndarray | None":
+        """Máscara vectorizada de una regla, o None si no aplica."""
+        if tipo == "directa":
+            valor = regla.get("condicion_valor")
+            if valor is None:
+                return None
+            return self._mask_condicion(
+                columnas, dtis, n,
+                regla.get("condicion_campo", ""),
+                regla.get("condicion_operador", "=="),
+                valor,
+            )
+
+        if tipo == "compensacion":
+            condiciones = regla.get("condiciones", [])
+            if not condiciones:
+                return np.zeros(n, dtype=bool)
+            mask = np.ones(n, dtype=bool)
+            for cond in condiciones:
+                if "campo_referencia" in cond:
+                    ref = self._columna(
+                        columnas, dtis,
+                        cond["campo_referencia"],
+                    )
+                    if ref is None:
+                        return np.zeros(n, dtype=bool)
+                    esperado = ref * cond.get("factor", 1.0)
+                else:
+                    esperado = cond.get("valor")
+                    if esperado is None:
+                        return None
+                parcial = self._mask_condicion(
+                    columnas, dtis, n,
+                    cond.get("campo", ""),
+                    cond.get("operador", "=="),
+                    esperado,
+                )
+                if parcial is None:
+                    return None
+                mask &= parcial
+                if not mask.any():
+                    break
+            return mask
 
-        return activadas
+        return np.zeros(n, dtype=bool)
+
+    def _mask_condicion(
+        self,
+        columnas,
+        dtis: "np.ndarray",
+        n: int,
+        campo: str,
+        operador: str,
+        esperado,
+    ) -> "np.ndarray | None":
+        """Evalúa una condición para el lote completo."""
+        fn = _OPS_VEC.get(operador)
+        if fn is None:
+            return np.zeros(n, dtype=bool)
+        col = self._columna(columnas, dtis, campo)
+        if col is None:
+            # Campo ausente: no-cumplida para todo el lote,
+            # igual que datos.get(campo) is None fila a fila.
+            return np.zeros(n, dtype=bool)
+        try:
+            mask = fn(col, esperado)
+        except TypeError:
+            return np.zeros(n, dtype=bool)
+        if not isinstance(mask, np.ndarray):
+            # Comparación de tipos incompatibles colapsada a
+            # escalar por NumPy
+            return np.full(n, bool(mask))
+        return mask.astype(bool, copy=False)
+
+    @staticmethod
+    def _columna(
+        columnas, dtis: "np.ndarray", campo: str
+    ) -> "np.ndarray | None":
+        """Resuelve la columna de un campo ('dti' incluido)."""
+        if campo == "dti":
+            return dtis
+        col = columnas.get(campo)
+        if col is None:
+            return None
+        return np.asarray(col)
+
+    @staticmethod
+    def _filas_de_columnas(
+        columnas, dtis: "np.ndarray", n: int
+    ) -> list[dict]:
+        """Materializa las filas dict (con 'dti') de un lote SoA."""
+        arrays = {
+            str(k): np.asarray(columnas[k])
+            for k in columnas.keys()
+        }
+        filas = []
+        for i in range(n):
+            fila = {k: v[i] for k, v in arrays.items()}
+            fila["dti"] = float(dtis[i])
+            filas.append(fila)
+        return filas
 
     def _evaluar_directa(
         self, datos: dict, regla: dict
@@ -356,22 +932,29 @@ class ScoringEngine:
     def _comparar(
         actual: Any, operador: str, esperado: Any
     ) -> bool:
-        """Compara dos valores según el operador dado."""
-        ops = {
-            "==": lambda a, b: a == b,
-            "!=": lambda a, b: a != b,
-            ">":  lambda a, b: a > b,
-            ">=": lambda a, b: a >= b,
-            "<":  lambda a, b: a < b,
-            "<=": lambda a, b: a <= b,
-        }
-        fn = ops.get(operador)
-        if fn is None:
-            return False
+        """Compara dos valores según el operador dado.
+
+        Cadena if/elif inline: sin el dict de lambdas que la
+        versión anterior reconstruía (y sondeaba) en cada
+        llamada, la comparación es un salto directo más el
+        operador en C. Operador desconocido → False.
+        """
         try:
-            return fn(actual, esperado)
+            if operador == "==":
+                return actual == esperado
+            elif operador == "!=":
+                return actual != esperado
+            elif operador == ">":
+                return actual > esperado
+            elif operador == ">=":
+                return actual >= esperado
+            elif operador == "<":
+                return actual < esperado
+            elif operador == "<=":
+                return actual <= esperado
         except TypeError:
             return False
+        return False
 
     # ────────────────────────────────────────────────────────
     # SCORE FINAL Y DICTAMEN
@@ -380,7 +963,7 @@ class ScoringEngine:
     def calculate_final_score(
         self,
         sub_scores: dict,
-        reglas_activadas: list[dict],
+        reglas_activadas: list[dict] | dict[str, list[dict]],
         monto_credito: float,
     ) -> tuple[int, int]:
         """Calcula el score final combinando sub-scores y reglas.
@@ -392,7 +975,8 @@ class ScoringEngine:
 
         Args:
             sub_scores: Dict con los 4 sub-scores.
-            reglas_activadas: Reglas que se activaron.
+            reglas_activadas: Reglas que se activaron, como lista
+                plana o como los grupos de apply_rules_bucketed().
             monto_credito: Monto solicitado.
 
         Returns:
@@ -408,17 +992,37 @@ class ScoringEngine:
         # 1. Suma de sub-scores
         base = sum(sub_scores.values())
 
-        # 2. Impacto de reglas
-        impacto_total = sum(
-            r["impacto"] for r in reglas_activadas
-        )
+        # 2. Impacto de reglas. Los grupos de apply_rules_bucketed()
+        # ya traen 'impacto_total' acumulado durante la activación;
+        # solo se suma aquí si llega una lista plana o un dict sin
+        # el acumulador (p. ej. construido a mano en tests).
+        if isinstance(reglas_activadas, dict):
+            impacto_total = reglas_activadas.get("impacto_total")
+            if impacto_total is None:
+                impacto_total = sum(
+                    r["impacto"]
+                    for clave, grupo in reglas_activadas.items()
+                    if clave != "impacto_total"
+                    for r in grupo
+                )
+        else:
+            impacto_total = sum(
+                r["impacto"] for r in reglas_activadas
+            )
         raw_score = base + impacto_total
 
         # 3. Clampeo
-        score_final = int(max(0, min(100, raw_score)))
+        cfg = self._cfg
+        score_final = int(max(
+            cfg.score_minimo, min(cfg.score_maximo, raw_score)
+        ))
 
         # 4. Umbral por monto
-        umbral = 85 if monto_credito > 20000 else 80
+        umbral = (
+            cfg.umbral_monto_alto
+            if monto_credito > cfg.monto_umbral_alto
+            else cfg.umbral_aprobado
+        )
 
         return (score_final, umbral)
 
@@ -448,14 +1052,14 @@ class ScoringEngine:
         """
         # DTI crítico → rechazo directo
         if dti_clasificacion == "CRITICO":
-            return "RECHAZADO"
+            return DICTAMEN_RECHAZADO
 
         if score >= umbral:
-            return "APROBADO"
-        elif score >= umbral - 20:
-            return "REVISION_MANUAL"
+            return DICTAMEN_APROBADO
+        elif score >= umbral - self._cfg.margen_revision:
+            return DICTAMEN_REVISION
         else:
-            return "RECHAZADO"
+            return DICTAMEN_RECHAZADO
 
 
 # ════════════════════════════════════════════════════════════
@@ -8,9 +8,20 @@
 # ============================================================
 
 import re
+import sys
 import logging
+from pathlib import Path
 from typing import Any
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from config import (  # noqa: E402
+    TIPOS_VIVIENDA_SET,
+    PROPOSITOS_CREDITO_SET,
+)
+
 logger = logging.getLogger(__name__)
 
 # ── Constantes de validación ────────────────────────────────
@@ -35,14 +46,12 @@ CAMPOS_TEXTO: list[str] = [
     "tipo_vivienda", "proposito_credito",
 ]
 
-TIPOS_VIVIENDA_VALIDOS: list[str] = [
-    "Propia", "Familiar", "Rentada",
-]
+# Alias de los frozensets precompilados en config: una sola
+# fuente para los dominios categóricos, con hash O(1) en las
+# pruebas de membresía por fila validada.
+TIPOS_VIVIENDA_VALIDOS: frozenset[str] = TIPOS_VIVIENDA_SET
 
-PROPOSITOS_VALIDOS: list[str] = [
-    "Negocio", "Educacion", "Consumo",
-    "Emergencia", "Vacaciones",
-]
+PROPOSITOS_VALIDOS: frozenset[str] = PROPOSITOS_CREDITO_SET
 
 
 class Validator:
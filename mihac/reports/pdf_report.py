@@ -195,6 +195,40 @@ class PDFReportGenerator:
         Returns:
             Ruta absoluta del PDF generado.
         """
+        html_str = self._html_completo(evaluacion)
+
+        # ── Generar PDF ──
+        out = Path(output_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        self._render_pdf(html_str, out)
+
+        logger.info("Reporte completo generado: %s", out)
+        return str(out.resolve())
+
+    def generate_complete_report_bytes(
+        self,
+        evaluacion: dict[str, Any],
+    ) -> bytes:
+        """Genera el reporte completo en memoria (sin disco).
+
+        Renderiza el mismo HTML que generate_complete_report
+        pero devuelve los bytes del PDF, pensado para servirse
+        directamente con send_file(BytesIO(...)).
+
+        Args:
+            evaluacion: Dict con datos de la evaluación.
+
+        Returns:
+            Contenido binario del PDF.
+        """
+        return self._render_pdf_bytes(
+            self._html_completo(evaluacion)
+        )
+
+    def _html_completo(
+        self, evaluacion: dict[str, Any]
+    ) -> str:
+        """Prepara el contexto y renderiza el HTML completo."""
         ev = _EvalProxy(evaluacion)
         timestamp = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
 
@@ -291,13 +325,7 @@ class PDFReportGenerator:
             factores_manuales=factores_manuales,
         )
 
-        # ── Generar PDF ──
-        out = Path(output_path)
-        out.parent.mkdir(parents=True, exist_ok=True)
-        self._render_pdf(html_str, out)
-
-        logger.info("Reporte completo generado: %s", out)
-        return str(out.resolve())
+        return html_str
 
     # ────────────────────────────────────────────────────────
     # REPORTE CLIENTE (simplificado)
@@ -321,6 +349,36 @@ class PDFReportGenerator:
         Returns:
             Ruta absoluta del PDF generado.
         """
+        html_str = self._html_cliente(evaluacion)
+
+        # ── Generar PDF ──
+        out = Path(output_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        self._render_pdf(html_str, out)
+
+        logger.info("Reporte cliente generado: %s", out)
+        return str(out.resolve())
+
+    def generate_client_report_bytes(
+        self,
+        evaluacion: dict[str, Any],
+    ) -> bytes:
+        """Genera el reporte cliente en memoria (sin disco).
+
+        Args:
+            evaluacion: Dict con datos de la evaluación.
+
+        Returns:
+            Contenido binario del PDF.
+        """
+        return self._render_pdf_bytes(
+            self._html_cliente(evaluacion)
+        )
+
+    def _html_cliente(
+        self, evaluacion: dict[str, Any]
+    ) -> str:
+        """Prepara el contexto y renderiza el HTML cliente."""
         ev = _EvalProxy(evaluacion)
         timestamp = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
 
@@ -373,13 +431,7 @@ class PDFReportGenerator:
             meses_recomendados=meses_recomendados,
         )
 
-        # ── Generar PDF ──
-        out = Path(output_path)
-        out.parent.mkdir(parents=True, exist_ok=True)
-        self._render_pdf(html_str, out)
-
-        logger.info("Reporte cliente generado: %s", out)
-        return str(out.resolve())
+        return html_str
 
     # ────────────────────────────────────────────────────────
     # BATCH
@@ -562,6 +614,33 @@ class PDFReportGenerator:
                         f"xhtml2pdf error: {status.err} errores"
                     )
 
+    @staticmethod
+    def _render_pdf_bytes(html_str: str) -> bytes:
+        """Renderiza HTML a PDF en memoria.
+
+        Igual que _render_pdf pero escribe en un BytesIO en
+        lugar de tocar el disco.
+
+        Args:
+            html_str: Contenido HTML renderizado.
+
+        Returns:
+            Contenido binario del PDF.
+        """
+        if _USE_WEASYPRINT:
+            return _WeasyHTML(string=html_str).write_pdf()
+        buf = io.BytesIO()
+        status = pisa.CreatePDF(
+            src=html_str,
+            dest=buf,
+            encoding="utf-8",
+        )
+        if status.err:
+            raise RuntimeError(
+                f"xhtml2pdf error: {status.err} errores"
+            )
+        return buf.getvalue()
+
     @staticmethod
     def _condicion_texto(regla: dict) -> str:
         """Genera texto legible de la condición de una regla."""
@@ -6,8 +6,16 @@
 # y descarga de PDFs.
 # ============================================================
 
+import base64
+from datetime import datetime
+
 import pytest
-from app.models import Evaluacion
+from app.models import Evaluacion, EvaluacionStats
+from app.routes import (
+    _codificar_cursor,
+    _decodificar_cursor,
+    bulk_evaluate,
+)
 from core.engine import InferenceEngine
 from tests.fixtures import CASO_IDEAL, CASO_RIESGO, CASO_GRIS
 
@@ -120,6 +128,50 @@ class TestConDatos:
         assert "1" in html  # al menos 1 evaluación total
 
 
+# ════════════════════════════════════════════════════════════
+# Cursor keyset del historial
+# ════════════════════════════════════════════════════════════
+
+class TestCursorHistorial:
+    """Tests para el códec base64 del cursor de paginación."""
+
+    def test_roundtrip_timestamp(self):
+        ts = datetime(2026, 8, 31, 12, 30, 45)
+        cursor = _codificar_cursor(ts.isoformat(), 42)
+        assert _decodificar_cursor(cursor, True) == (ts, 42)
+
+    def test_roundtrip_score(self):
+        cursor = _codificar_cursor(87, 99)
+        assert _decodificar_cursor(cursor, False) == (87, 99)
+
+    def test_cursor_no_base64(self):
+        assert _decodificar_cursor("%%%invalido%%%", False) is None
+
+    def test_cursor_sin_separador(self):
+        # base64 válido pero sin el separador valor|id
+        bruto = base64.urlsafe_b64encode(
+            b"basura-sin-separador"
+        ).decode("ascii")
+        assert _decodificar_cursor(bruto, False) is None
+
+    def test_cursor_timestamp_invalido(self):
+        cursor = _codificar_cursor("no-es-fecha", 1)
+        assert _decodificar_cursor(cursor, True) is None
+
+    def test_cursor_id_no_numerico(self):
+        bruto = base64.urlsafe_b64encode(
+            b"85|no-es-id"
+        ).decode("ascii")
+        assert _decodificar_cursor(bruto, False) is None
+
+    def test_historial_cursor_invalido(
+        self, client, evaluacion_guardada
+    ):
+        # Cursor manipulado → primera página, sin error 500
+        resp = client.get("/historial?cursor=@@@invalido@@@")
+        assert resp.status_code == 200
+
+
 # ════════════════════════════════════════════════════════════
 # Descarga de PDFs
 # ════════════════════════════════════════════════════════════
@@ -150,3 +202,160 @@ class TestPDF:
         resp = client.get(f"/resultado/{ev_id}/pdf")
         # PDF must start with %PDF-
         assert resp.data[:5] == b"%PDF-"
+
+
+# ════════════════════════════════════════════════════════════
+# KPIs materializados (EvaluacionStats)
+# ════════════════════════════════════════════════════════════
+
+class TestEvaluacionStats:
+    """Tests para registrar() y recompute() de los KPIs."""
+
+    @staticmethod
+    def _fila(score, dictamen, dti, monto=15000.0,
+              proposito="Negocio"):
+        """Construye una Evaluacion mínima sin pasar por el motor."""
+        return Evaluacion(
+            edad=35,
+            ingreso_mensual=25000.0,
+            total_deuda_actual=4000.0,
+            historial_crediticio=2,
+            antiguedad_laboral=7,
+            numero_dependientes=1,
+            tipo_vivienda="Propia",
+            proposito_credito=proposito,
+            monto_credito=monto,
+            score_final=score,
+            dti_ratio=dti,
+            dti_clasificacion="BAJO",
+            dictamen=dictamen,
+            umbral_aplicado=80,
+            reglas_activadas=[],
+            sub_scores={},
+            reporte_explicacion="",
+        )
+
+    @staticmethod
+    def _limpiar(db_session):
+        """Parte de cero: sin evaluaciones ni fila de stats."""
+        Evaluacion.query.delete()
+        EvaluacionStats.query.delete()
+        db_session.commit()
+
+    def test_registrar_acumula_contadores(self, db_session):
+        self._limpiar(db_session)
+        casos = [
+            (85, "APROBADO", 0.16, "Negocio"),
+            (45, "RECHAZADO", 0.70, "Consumo"),
+            (70, "REVISION_MANUAL", 0.30, "Negocio"),
+        ]
+        for score, dictamen, dti, prop in casos:
+            ev = self._fila(score, dictamen, dti,
+                            proposito=prop)
+            db_session.add(ev)
+            EvaluacionStats.registrar(ev)
+        db_session.commit()
+
+        stats = db_session.get(EvaluacionStats, 1)
+        assert stats.total == 3
+        assert stats.aprobados == 1
+        assert stats.rechazados == 1
+        assert stats.revision == 1
+        assert stats.sum_score == 200
+        assert stats.sum_monto == 45000.0
+        # Buckets de score: 85→b4, 45→b2, 70→b3
+        assert (stats.score_b4, stats.score_b3,
+                stats.score_b2) == (1, 1, 1)
+        # Buckets de DTI: 0.16→b0, 0.30→b1, 0.70→b3
+        assert (stats.dti_b0, stats.dti_b1,
+                stats.dti_b3) == (1, 1, 1)
+        assert stats.propositos == {
+            "Negocio": 2, "Consumo": 1,
+        }
+
+    def test_recompute_coincide_con_registrar(
+        self, db_session
+    ):
+        self._limpiar(db_session)
+        for score, dictamen, dti in (
+            (92, "APROBADO", 0.10),
+            (58, "RECHAZADO", 0.45),
+            (61, "REVISION_MANUAL", 0.28),
+            (81, "APROBADO", 0.22),
+        ):
+            ev = self._fila(score, dictamen, dti)
+            db_session.add(ev)
+            EvaluacionStats.registrar(ev)
+        db_session.commit()
+
+        antes = db_session.get(EvaluacionStats, 1)
+        esperado = {
+            c.name: getattr(antes, c.name)
+            for c in EvaluacionStats.__table__.columns
+        }
+
+        despues = EvaluacionStats.recompute()
+        for campo, valor in esperado.items():
+            assert getattr(despues, campo) == valor, campo
+
+    def test_recompute_corrige_deriva(self, db_session):
+        self._limpiar(db_session)
+        # Carga que NO pasa por registrar(): deriva
+        db_session.add(self._fila(85, "APROBADO", 0.16))
+        db_session.add(self._fila(40, "RECHAZADO", 0.65))
+        db_session.commit()
+
+        stats = EvaluacionStats.recompute()
+        assert stats.total == 2
+        assert stats.aprobados == 1
+        assert stats.rechazados == 1
+        assert stats.sum_score == 125
+
+
+# ════════════════════════════════════════════════════════════
+# Ingesta masiva (bulk_evaluate y CLI evaluar-lote)
+# ════════════════════════════════════════════════════════════
+
+class TestIngestaMasiva:
+    """Tests para bulk_evaluate() y el comando evaluar-lote."""
+
+    def test_lote_vacio(self, db_session):
+        assert bulk_evaluate([]) == 0
+
+    def test_lote_valido_inserta_y_recalcula(self, db_session):
+        antes = Evaluacion.query.count()
+        n = bulk_evaluate([
+            CASO_IDEAL.copy(),
+            CASO_RIESGO.copy(),
+        ])
+        assert n == 2
+        assert Evaluacion.query.count() == antes + 2
+        stats = db_session.get(EvaluacionStats, 1)
+        assert stats.total == Evaluacion.query.count()
+
+    def test_lote_omite_filas_invalidas(self, db_session):
+        invalido = CASO_IDEAL.copy()
+        invalido["edad"] = 10  # menor de edad → validación
+        n = bulk_evaluate([CASO_IDEAL.copy(), invalido])
+        assert n == 1
+
+    def test_cli_evaluar_lote(self, app, db_session, tmp_path):
+        columnas = list(CASO_IDEAL)
+        invalido = CASO_IDEAL.copy()
+        invalido["edad"] = 10
+        csv_path = tmp_path / "solicitudes.csv"
+        with open(csv_path, "w", newline="",
+                  encoding="utf-8") as f:
+            f.write(",".join(columnas) + "\n")
+            for fila in (CASO_IDEAL, invalido):
+                f.write(",".join(
+                    str(fila[c]) for c in columnas
+                ) + "\n")
+
+        runner = app.test_cli_runner()
+        resultado = runner.invoke(
+            args=["main", "evaluar-lote", str(csv_path)]
+        )
+        assert resultado.exit_code == 0
+        assert "1 evaluaciones insertadas" in resultado.output
+
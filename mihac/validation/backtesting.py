@@ -352,7 +352,7 @@ class Backtester:
             "n_errores_fp": len(self._errores_fp) if self._errores_fp is not None else 0,
             "n_errores_fn": len(self._errores_fn) if self._errores_fn is not None else 0,
             "interpretacion": self.metrics.interpret(self._metricas) if self._metricas else "",
-            "stats_engine": self.engine.stats,
+            "stats_engine": dict(self.engine.stats),
             "perfil_errores": self._perfil_errores(),
         }
 